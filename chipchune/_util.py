@@ -4,10 +4,13 @@ This is for internal use; not to be confused with
 """
 
 import struct
+from dataclasses import fields
 from enum import Enum
-from typing import BinaryIO, Any, cast
+from typing import BinaryIO, Any, List, Tuple, Type, TypeVar, Union, cast
 import io
 
+T = TypeVar("T")
+
 known_sizes = {
     "c": 1,
     "b": 1,
@@ -49,6 +52,29 @@ class EnumValueEquals(Enum):
         return cast(bool, self.value == other)
 
 
+def dataclass_slots(cls: Type[T]) -> Type[T]:
+    """
+    Recreates a dataclass with ``__slots__`` for all of its fields, so
+    its instances don't carry a ``__dict__``. Stands in for
+    ``@dataclass(slots=True)``, which needs Python 3.10. Apply it on top
+    of ``@dataclass``.
+
+    :param cls: A dataclass.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cast(Any, cls)))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # defaults are already part of the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    metaclass: Any = type(cls)
+    new_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    return cast(Type[T], new_cls)
+
+
 def truthy_to_boolbyte(value: Any) -> bytes:
     """
     If value is truthy, output b'\x01'. Else output b'\x00'.
@@ -61,6 +87,16 @@ def truthy_to_boolbyte(value: Any) -> bytes:
         return b"\x00"
 
 
+# precompiled scalar formats, shared by the read_* functions and Cursor
+U8 = struct.Struct("<B")
+U16 = struct.Struct("<H")
+U32 = struct.Struct("<I")
+I8 = struct.Struct("<b")
+I16 = struct.Struct("<h")
+I32 = struct.Struct("<i")
+F32 = struct.Struct("<f")
+
+
 # these are just to make the typehinter happy
 # cast(dolphin, foobar) should've been named trust_me_bro_im_a(dolphin, foobar)
 
@@ -70,8 +106,8 @@ def read_int(file: BinaryIO, signed: bool = False) -> int:
     4 bytes
     """
     if signed:
-        return cast(int, struct.unpack("<i", file.read(known_sizes["i"]))[0])
-    return cast(int, struct.unpack("<I", file.read(known_sizes["I"]))[0])
+        return cast(int, I32.unpack(file.read(4))[0])
+    return cast(int, U32.unpack(file.read(4))[0])
 
 
 def read_short(file: BinaryIO, signed: bool = False) -> int:
@@ -79,8 +115,8 @@ def read_short(file: BinaryIO, signed: bool = False) -> int:
     2 bytes
     """
     if signed:
-        return cast(int, struct.unpack("<h", file.read(known_sizes["h"]))[0])
-    return cast(int, struct.unpack("<H", file.read(known_sizes["H"]))[0])
+        return cast(int, I16.unpack(file.read(2))[0])
+    return cast(int, U16.unpack(file.read(2))[0])
 
 
 def read_byte(file: BinaryIO, signed: bool = False) -> int:
@@ -88,15 +124,15 @@ def read_byte(file: BinaryIO, signed: bool = False) -> int:
     1 bytes
     """
     if signed:
-        return cast(int, struct.unpack("<b", file.read(known_sizes["b"]))[0])
-    return cast(int, struct.unpack("<B", file.read(known_sizes["B"]))[0])
+        return cast(int, I8.unpack(file.read(1))[0])
+    return cast(int, U8.unpack(file.read(1))[0])
 
 
 def read_float(file: BinaryIO) -> float:
     """
     4 bytes
     """
-    return cast(float, struct.unpack("<f", file.read(known_sizes["f"]))[0])
+    return cast(float, F32.unpack(file.read(4))[0])
 
 
 def read_str(file: BinaryIO) -> str:
@@ -109,3 +145,211 @@ def read_str(file: BinaryIO) -> str:
         buffer += char
         char = file.read(1)
     return buffer.decode("utf-8")
+
+
+def read_ints(file: BinaryIO, count: int, signed: bool = False) -> List[int]:
+    """
+    4 bytes * count
+    """
+    fmt = "<%d%s" % (count, "i" if signed else "I")
+    return list(struct.unpack(fmt, file.read(count * known_sizes["I"])))
+
+
+class Cursor:
+    """
+    Reads little-endian values from an in-memory buffer, keeping track
+    of the current position. Values are decoded in place, without
+    slicing the buffer for each read.
+    """
+
+    __slots__ = ("buf", "pos")
+
+    def __init__(self, buf: bytes, pos: int = 0) -> None:
+        """
+        :param buf: Data to read from.
+        :param pos: Starting position.
+        """
+        self.buf = buf
+        self.pos = pos
+
+    def unpack(self, fmt: Union[str, struct.Struct]) -> Tuple[Any, ...]:
+        """
+        Decode a struct at the current position and advance past it.
+
+        :param fmt: Struct format string or a precompiled :class:`struct.Struct`.
+        """
+        if isinstance(fmt, str):
+            fmt = struct.Struct(fmt)
+        values = fmt.unpack_from(self.buf, self.pos)
+        self.pos += fmt.size
+        return values
+
+    def u8(self) -> int:
+        """
+        1 bytes
+        """
+        value = U8.unpack_from(self.buf, self.pos)[0]
+        self.pos += 1
+        return cast(int, value)
+
+    def u16(self) -> int:
+        """
+        2 bytes
+        """
+        value = U16.unpack_from(self.buf, self.pos)[0]
+        self.pos += 2
+        return cast(int, value)
+
+    def u32(self) -> int:
+        """
+        4 bytes
+        """
+        value = U32.unpack_from(self.buf, self.pos)[0]
+        self.pos += 4
+        return cast(int, value)
+
+    def f32(self) -> float:
+        """
+        4 bytes
+        """
+        value = F32.unpack_from(self.buf, self.pos)[0]
+        self.pos += 4
+        return cast(float, value)
+
+    def u8s(self, count: int) -> List[int]:
+        """
+        1 bytes * count
+        """
+        return list(self.unpack("<%dB" % count))
+
+    def u16s(self, count: int) -> List[int]:
+        """
+        2 bytes * count
+        """
+        return list(self.unpack("<%dH" % count))
+
+    def u32s(self, count: int) -> List[int]:
+        """
+        4 bytes * count
+        """
+        return list(self.unpack("<%dI" % count))
+
+    def cstr(self) -> str:
+        """
+        variable string (ends in \\x00)
+        """
+        end = self.buf.find(b"\x00", self.pos)
+        if end < 0:
+            raise struct.error("unterminated string")
+        value = self.buf[self.pos : end].decode("utf-8")
+        self.pos = end + 1
+        return value
+
+    def read(self, count: int) -> bytes:
+        """
+        Raw bytes. Like a file, this returns fewer bytes at the end of the
+        buffer instead of failing.
+        """
+        value = self.buf[self.pos : self.pos + count]
+        self.pos += len(value)
+        return value
+
+    def skip(self, count: int) -> None:
+        """
+        Advance past `count` bytes without decoding them.
+        """
+        self.pos += count
+
+
+class StreamCursor:
+    """
+    Same interface as :class:`Cursor`, but reads straight from a stream.
+    For blocks whose size isn't known up front, where reading them into
+    memory first would mean reading the rest of the stream.
+    """
+
+    __slots__ = ("stream",)
+
+    def __init__(self, stream: BinaryIO) -> None:
+        """
+        :param stream: Stream positioned at the start of the block.
+        """
+        self.stream = stream
+
+    def unpack(self, fmt: Union[str, struct.Struct]) -> Tuple[Any, ...]:
+        """
+        Decode a struct at the current position and advance past it.
+
+        :param fmt: Struct format string or a precompiled :class:`struct.Struct`.
+        """
+        if isinstance(fmt, str):
+            fmt = struct.Struct(fmt)
+        return fmt.unpack(self.stream.read(fmt.size))
+
+    def u8(self) -> int:
+        """
+        1 bytes
+        """
+        return cast(int, U8.unpack(self.stream.read(1))[0])
+
+    def u16(self) -> int:
+        """
+        2 bytes
+        """
+        return cast(int, U16.unpack(self.stream.read(2))[0])
+
+    def u32(self) -> int:
+        """
+        4 bytes
+        """
+        return cast(int, U32.unpack(self.stream.read(4))[0])
+
+    def f32(self) -> float:
+        """
+        4 bytes
+        """
+        return cast(float, F32.unpack(self.stream.read(4))[0])
+
+    def u8s(self, count: int) -> List[int]:
+        """
+        1 bytes * count
+        """
+        return list(self.unpack("<%dB" % count))
+
+    def u16s(self, count: int) -> List[int]:
+        """
+        2 bytes * count
+        """
+        return list(self.unpack("<%dH" % count))
+
+    def u32s(self, count: int) -> List[int]:
+        """
+        4 bytes * count
+        """
+        return list(self.unpack("<%dI" % count))
+
+    def cstr(self) -> str:
+        """
+        variable string (ends in \\x00)
+        """
+        buffer = bytearray()
+        char = self.stream.read(1)
+        while char != b"\x00":
+            if not char:
+                raise struct.error("unterminated string")
+            buffer += char
+            char = self.stream.read(1)
+        return buffer.decode("utf-8")
+
+    def read(self, count: int) -> bytes:
+        """
+        Raw bytes. Like a file, this returns fewer bytes at the end of the
+        stream instead of failing.
+        """
+        return self.stream.read(count)
+
+    def skip(self, count: int) -> None:
+        """
+        Advance past `count` bytes without decoding them.
+        """
+        self.stream.seek(count, io.SEEK_CUR)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Tuple, List, TypedDict, Any, Union, Dict
 
+from chipchune._util import dataclass_slots
+
 from .enums import (
     ChipType,
     LinearPitch,
@@ -24,6 +26,7 @@ from .enums import (
 
 
 # modules
+@dataclass_slots
 @dataclass
 class ChipInfo:
     """
@@ -41,6 +44,7 @@ class ChipInfo:
     volume: float = 1.0
 
 
+@dataclass_slots
 @dataclass
 class ModuleMeta:
     """
@@ -77,6 +81,7 @@ class TimingInfo:
     virtual_tempo: Tuple[int, int] = (150, 150)
 
 
+@dataclass_slots
 @dataclass
 class ChipList:
     """
@@ -87,6 +92,7 @@ class ChipList:
     master_volume: float = 2.0
 
 
+@dataclass_slots
 @dataclass(repr=False)
 class ChannelDisplayInfo:
     """
@@ -188,6 +194,7 @@ class ModuleCompatFlags:
     old_sample_offset: bool = False
 
 
+@dataclass_slots
 @dataclass
 class SubSong:
     """
@@ -202,7 +209,6 @@ class SubSong:
     """
     grooves: List[List[int]] = field(default_factory=list)
     timing: TimingInfo = field(default_factory=TimingInfo)
-    pattern_length = 64
     order: Dict[int, List[int]] = field(
         default_factory=lambda: {
             0: [0],
@@ -228,8 +234,10 @@ class SubSong:
             for _ in range(ChipType.YM2612.channels + ChipType.SMS.channels)
         ]
     )
+    pattern_length: int = 64
 
 
+@dataclass_slots
 @dataclass
 class FurnaceRow:
     """
@@ -372,6 +380,7 @@ class OutputPatchBayEntry(TypedDict):
     """
 
 
+@dataclass_slots
 @dataclass
 class PatchBay:
     """
@@ -725,6 +734,7 @@ class InsFeatureWaveList(_InsFeaturePointerAbstract):
     _code = "WL"
 
 
+@dataclass_slots
 @dataclass
 class WavetableMeta:
     name: str = ""
@@ -732,6 +742,7 @@ class WavetableMeta:
     height: int = 32
 
 
+@dataclass_slots
 @dataclass
 class SampleMeta:
     name: str = ""
@@ -1,7 +1,23 @@
+import struct
 from io import BytesIO
-from typing import Optional, Union, BinaryIO, TypeVar, Type, List, Dict, cast
+from typing import (
+    Optional,
+    Union,
+    BinaryIO,
+    TypeVar,
+    Type,
+    List,
+    Tuple,
+    Callable,
+)
 
-from chipchune._util import read_byte, read_short, read_int, read_str
+from chipchune._util import (
+    read_short,
+    read_int,
+    read_ints,
+    Cursor,
+    StreamCursor,
+)
 from .data_types import (
     InsFeatureAbstract,
     InsFeatureMacro,
@@ -60,6 +76,23 @@ T_MACRO = TypeVar(
 )  # T_MACRO must be subclass of InsFeatureMacro
 T_POINTERS = TypeVar("T_POINTERS", bound=_InsFeaturePointerAbstract)
 
+# speeds then delays of 20 macros, for the standard macros followed by
+# each of the 4 operators, used by the old instrument format
+MACRO_SPEED_DELAY = struct.Struct("<" + "20B20B" * 5)
+
+# fixed layouts of the old instrument format
+ES5506_PARAMS = struct.Struct("<B3H6B")
+FM_OP_PARAMS = struct.Struct("<22B10x")
+C64_PARAMS = struct.Struct("<4BH10BH6B")
+MULTIPCM_PARAMS = struct.Struct("<9B23x")
+SNES_PARAMS = struct.Struct("<7B")
+
+# raw value -> member lookups, skipping the enum constructor. values that
+# aren't listed still go through the constructor so they raise ValueError
+ES_FILTER_MODES = {mode.value: mode for mode in ESFilterMode}
+GAIN_MODES = {mode.value: mode for mode in GainMode}
+SNES_SUS_MODES = {mode.value: mode for mode in SNESSusMode}
+
 
 class FurnaceInstrument:
     def __init__(
@@ -190,8 +223,8 @@ class FurnaceInstrument:
             read_int(stream)  # reserved
 
             # these don't exist for format 1 instrs.
-            self.__wavetable_ptr = [read_int(stream) for _ in range(num_waves)]
-            self.__sample_ptr = [read_int(stream) for _ in range(num_samples)]
+            self.__wavetable_ptr = read_ints(stream, num_waves)
+            self.__sample_ptr = read_ints(stream, num_samples)
 
             stream.seek(ins_data_ptr)
             self.__load_format_0_embed(stream)
@@ -241,7 +274,7 @@ class FurnaceInstrument:
             return None
 
         len_block = read_short(stream)
-        feature_block = BytesIO(stream.read(len_block))
+        feature_block = Cursor(stream.read(len_block))
 
         # if this fails it might be a malformed file
         return self.__map_to_fn[code](feature_block)
@@ -260,14 +293,14 @@ class FurnaceInstrument:
 
     # format 1 features
 
-    def __load_na_block(self, stream: BytesIO) -> InsFeatureName:
-        return InsFeatureName(read_str(stream))
+    def __load_na_block(self, stream: Cursor) -> InsFeatureName:
+        return InsFeatureName(stream.cstr())
 
-    def __load_fm_block(self, stream: BytesIO) -> InsFeatureFM:
+    def __load_fm_block(self, stream: Cursor) -> InsFeatureFM:
         fm = InsFeatureFM()
 
         # read base data
-        data = [read_byte(stream) for _ in range(4)]
+        data = stream.u8s(4)
 
         current = data.pop(0)
         ops = current & 0b1111
@@ -295,7 +328,7 @@ class FurnaceInstrument:
 
         # read operators
         for op in range(ops):
-            data = [read_byte(stream) for _ in range(8)]
+            data = stream.u8s(8)
 
             current = data.pop(0)
             fm.op_list[op].ksr = bool(current & 128)
@@ -336,10 +369,10 @@ class FurnaceInstrument:
 
         return fm
 
-    def __common_ma_block(self, stream: BytesIO, macro_class: Type[T_MACRO]) -> T_MACRO:
+    def __common_ma_block(self, stream: Cursor, macro_class: Type[T_MACRO]) -> T_MACRO:
         ma = macro_class()
         ma.macros.clear()
-        read_short(stream)  # header size
+        stream.u16()  # header size
 
         target_code: Union[MacroCode, OpMacroCode]
 
@@ -349,25 +382,25 @@ class FurnaceInstrument:
             InsFeatureOpr3Macro,
             InsFeatureOpr4Macro,
         ]:
-            target_code = OpMacroCode(read_byte(stream))
+            target_code = OpMacroCode(stream.u8())
         else:
-            target_code = MacroCode(read_byte(stream))
+            target_code = MacroCode(stream.u8())
 
         while target_code != MacroCode.STOP:
             new_macro = SingleMacro(kind=target_code)
 
-            length = read_byte(stream)
-            loop = read_byte(stream)
-            release = read_byte(stream)
+            length = stream.u8()
+            loop = stream.u8()
+            release = stream.u8()
 
-            new_macro.mode = read_byte(stream)
-            flags = read_byte(stream)
+            new_macro.mode = stream.u8()
+            flags = stream.u8()
 
             word_size = MacroSize(flags >> 6 & 0b11)  # type: ignore
             new_macro.type = MacroType(flags >> 1 & 0b11)
             new_macro.open = bool(flags & 1)
-            new_macro.delay = read_byte(stream)
-            new_macro.speed = read_byte(stream)
+            new_macro.delay = stream.u8()
+            new_macro.speed = stream.u8()
 
             # adsr and lfo will simply be kept as a list
             macro_content: List[Union[int, MacroItem]] = [
@@ -395,31 +428,31 @@ class FurnaceInstrument:
                 InsFeatureOpr3Macro,
                 InsFeatureOpr4Macro,
             ]:
-                target_code = OpMacroCode(read_byte(stream))
+                target_code = OpMacroCode(stream.u8())
             else:
-                target_code = MacroCode(read_byte(stream))
+                target_code = MacroCode(stream.u8())
 
         return ma
 
-    def __load_ma_block(self, stream: BytesIO) -> InsFeatureMacro:
+    def __load_ma_block(self, stream: Cursor) -> InsFeatureMacro:
         return self.__common_ma_block(stream, InsFeatureMacro)
 
-    def __load_o1_block(self, stream: BytesIO) -> InsFeatureOpr1Macro:
+    def __load_o1_block(self, stream: Cursor) -> InsFeatureOpr1Macro:
         return self.__common_ma_block(stream, InsFeatureOpr1Macro)
 
-    def __load_o2_block(self, stream: BytesIO) -> InsFeatureOpr2Macro:
+    def __load_o2_block(self, stream: Cursor) -> InsFeatureOpr2Macro:
         return self.__common_ma_block(stream, InsFeatureOpr2Macro)
 
-    def __load_o3_block(self, stream: BytesIO) -> InsFeatureOpr3Macro:
+    def __load_o3_block(self, stream: Cursor) -> InsFeatureOpr3Macro:
         return self.__common_ma_block(stream, InsFeatureOpr3Macro)
 
-    def __load_o4_block(self, stream: BytesIO) -> InsFeatureOpr4Macro:
+    def __load_o4_block(self, stream: Cursor) -> InsFeatureOpr4Macro:
         return self.__common_ma_block(stream, InsFeatureOpr4Macro)
 
-    def __load_c64_block(self, stream: BytesIO) -> InsFeatureC64:
+    def __load_c64_block(self, stream: Cursor) -> InsFeatureC64:
         c64 = InsFeatureC64()
 
-        data = [read_byte(stream) for _ in range(4)]
+        data = stream.u8s(4)
 
         current = data.pop(0)
         c64.duty_is_abs = bool((current >> 7) & 1)
@@ -449,18 +482,18 @@ class FurnaceInstrument:
         c64.envelope.s = (current >> 4) & 0b1111
         c64.envelope.r = current & 0b1111
 
-        c64.duty = read_short(stream)
+        c64.duty = stream.u16()
 
-        c_r = read_short(stream)
+        c_r = stream.u16()
         c64.cut = c_r & 0b1111111111
         c64.res = (c_r >> 12) & 0b1111
 
         return c64
 
-    def __load_gb_block(self, stream: BytesIO) -> InsFeatureGB:
+    def __load_gb_block(self, stream: Cursor) -> InsFeatureGB:
         gb = InsFeatureGB()
 
-        data = [read_byte(stream) for _ in range(4)]
+        data = stream.u8s(4)
 
         current = data.pop(0)
         gb.env_vol = current & 0b1111
@@ -475,178 +508,172 @@ class FurnaceInstrument:
 
         hw_seq_len = data.pop(0)
         for i in range(hw_seq_len):
-            seq_entry = GBHwSeq(GBHwCommand(read_byte(stream)))
-            seq_entry.data = [read_byte(stream), read_byte(stream)]
+            seq_entry = GBHwSeq(GBHwCommand(stream.u8()))
+            seq_entry.data = list(stream.unpack("<BB"))
             gb.hw_seq.append(seq_entry)
 
         return gb
 
-    def __load_sm_block(self, stream: BytesIO) -> InsFeatureAmiga:
+    def __load_sm_block(self, stream: Cursor) -> InsFeatureAmiga:
         sm = InsFeatureAmiga()
 
-        sm.init_sample = read_short(stream)
+        sm.init_sample = stream.u16()
 
-        current = read_byte(stream)
+        current = stream.u8()
         sm.use_wave = bool((current >> 2) & 1)
         sm.use_sample = bool((current >> 1) & 1)
         sm.use_note_map = bool(current & 1)
 
-        sm.wave_len = read_byte(stream)
+        sm.wave_len = stream.u8()
 
         if sm.use_note_map:
             for i in range(len(sm.sample_map)):
-                sm.sample_map[i].freq = read_short(stream)
-                sm.sample_map[i].sample_index = read_short(stream)
+                sm.sample_map[i].freq = stream.u16()
+                sm.sample_map[i].sample_index = stream.u16()
 
         return sm
 
-    def __load_ld_block(self, stream: BytesIO) -> InsFeatureOPLDrums:
+    def __load_ld_block(self, stream: Cursor) -> InsFeatureOPLDrums:
         return InsFeatureOPLDrums(
-            fixed_drums=bool(read_byte(stream) & 1),
-            kick_freq=read_short(stream),
-            snare_hat_freq=read_short(stream),
-            tom_top_freq=read_short(stream),
+            fixed_drums=bool(stream.u8() & 1),
+            kick_freq=stream.u16(),
+            snare_hat_freq=stream.u16(),
+            tom_top_freq=stream.u16(),
         )
 
-    def __load_sn_block(self, stream: BytesIO) -> InsFeatureSNES:
+    def __load_sn_block(self, stream: Cursor) -> InsFeatureSNES:
         sn = InsFeatureSNES()
 
-        data = [read_byte(stream) for _ in range(4)]
+        env_ad, env_sr, flags, sn.gain = stream.unpack("<4B")
 
-        current = data.pop(0)
-        sn.envelope.d = (current >> 4) & 0b1111
-        sn.envelope.a = current & 0b1111
+        sn.envelope.d = (env_ad >> 4) & 0b1111
+        sn.envelope.a = env_ad & 0b1111
 
-        current = data.pop(0)
-        sn.envelope.s = (current >> 4) & 0b1111
-        sn.envelope.r = current & 0b1111
+        sn.envelope.s = (env_sr >> 4) & 0b1111
+        sn.envelope.r = env_sr & 0b1111
 
-        current = data.pop(0)
-        sn.use_env = bool((current >> 4) & 1)
-        sn.sus = SNESSusMode((current >> 3) & 1)
+        sn.use_env = bool((flags >> 4) & 1)
+        sn.sus = SNES_SUS_MODES[(flags >> 3) & 1]
 
-        gain_mode = current & 0b111
-        if current < 4:
+        gain_mode = flags & 0b111
+        if flags < 4:
             gain_mode = 0
-        sn.gain_mode = GainMode(gain_mode)
-
-        sn.gain = data.pop(0)
+        sn.gain_mode = GAIN_MODES.get(gain_mode) or GainMode(gain_mode)
 
         if self.meta.version >= 131:
-            d2s = read_byte(stream)
-            sn.sus = SNESSusMode((d2s >> 5 & 0b11))
+            d2s = stream.u8()
+            sn.sus = SNES_SUS_MODES[d2s >> 5 & 0b11]
             sn.d2 = d2s & 31
 
         return sn
 
-    def __load_n1_block(self, stream: BytesIO) -> InsFeatureN163:
+    def __load_n1_block(self, stream: Cursor) -> InsFeatureN163:
         return InsFeatureN163(
-            wave=read_int(stream),
-            wave_pos=read_byte(stream),
-            wave_len=read_byte(stream),
-            wave_mode=read_byte(stream),
+            wave=stream.u32(),
+            wave_pos=stream.u8(),
+            wave_len=stream.u8(),
+            wave_mode=stream.u8(),
         )
 
-    def __load_fd_block(self, stream: BytesIO) -> InsFeatureFDS:
+    def __load_fd_block(self, stream: Cursor) -> InsFeatureFDS:
         fd = InsFeatureFDS(
-            mod_speed=read_int(stream),
-            mod_depth=read_int(stream),
-            init_table_with_first_wave=bool(read_byte(stream)),
+            mod_speed=stream.u32(),
+            mod_depth=stream.u32(),
+            init_table_with_first_wave=bool(stream.u8()),
         )
-        for i in range(32):
-            fd.mod_table[i] = read_byte(stream)
+        fd.mod_table = list(stream.unpack("<32B"))
         return fd
 
-    def __load_ws_block(self, stream: BytesIO) -> InsFeatureWaveSynth:
+    def __load_ws_block(self, stream: Cursor) -> InsFeatureWaveSynth:
         return InsFeatureWaveSynth(
-            wave_indices=[read_int(stream), read_int(stream)],
-            rate_divider=read_byte(stream),
-            effect=WaveFX(read_byte(stream)),
-            enabled=bool(read_byte(stream) & 1),
-            global_effect=bool(read_byte(stream) & 1),
-            speed=read_byte(stream),
+            wave_indices=[stream.u32(), stream.u32()],
+            rate_divider=stream.u8(),
+            effect=WaveFX(stream.u8()),
+            enabled=bool(stream.u8() & 1),
+            global_effect=bool(stream.u8() & 1),
+            speed=stream.u8(),
             params=[
-                read_byte(stream),
-                read_byte(stream),
-                read_byte(stream),
-                read_byte(stream),
+                stream.u8(),
+                stream.u8(),
+                stream.u8(),
+                stream.u8(),
             ],
         )
 
     def __common_pointers_block(
-        self, stream: BytesIO, ptr_class: Type[T_POINTERS]
+        self, stream: Cursor, ptr_class: Type[T_POINTERS]
     ) -> T_POINTERS:
         pt = ptr_class()
-        num_entries = read_byte(stream)
+        num_entries = stream.u8()
 
         for _ in range(num_entries):
-            pt.pointers[read_byte(stream)] = -1
+            pt.pointers[stream.u8()] = -1
 
         for i in pt.pointers:
-            pt.pointers[i] = read_int(stream)
+            pt.pointers[i] = stream.u32()
 
         return pt
 
-    def __load_sl_block(self, stream: BytesIO) -> InsFeatureSampleList:
+    def __load_sl_block(self, stream: Cursor) -> InsFeatureSampleList:
         return self.__common_pointers_block(stream, InsFeatureSampleList)
 
-    def __load_wl_block(self, stream: BytesIO) -> InsFeatureWaveList:
+    def __load_wl_block(self, stream: Cursor) -> InsFeatureWaveList:
         return self.__common_pointers_block(stream, InsFeatureWaveList)
 
-    def __load_mp_block(self, stream: BytesIO) -> InsFeatureMultiPCM:
+    def __load_mp_block(self, stream: Cursor) -> InsFeatureMultiPCM:
         return InsFeatureMultiPCM(
-            ar=read_byte(stream),
-            d1r=read_byte(stream),
-            dl=read_byte(stream),
-            d2r=read_byte(stream),
-            rr=read_byte(stream),
-            rc=read_byte(stream),
-            lfo=read_byte(stream),
-            vib=read_byte(stream),
-            am=read_byte(stream),
+            ar=stream.u8(),
+            d1r=stream.u8(),
+            dl=stream.u8(),
+            d2r=stream.u8(),
+            rr=stream.u8(),
+            rc=stream.u8(),
+            lfo=stream.u8(),
+            vib=stream.u8(),
+            am=stream.u8(),
         )
 
-    def __load_su_block(self, stream: BytesIO) -> InsFeatureSoundUnit:
-        return InsFeatureSoundUnit(switch_roles=bool(read_byte(stream)))
+    def __load_su_block(self, stream: Cursor) -> InsFeatureSoundUnit:
+        return InsFeatureSoundUnit(switch_roles=bool(stream.u8()))
 
-    def __load_es_block(self, stream: BytesIO) -> InsFeatureES5506:
+    def __load_es_block(self, stream: Cursor) -> InsFeatureES5506:
         return InsFeatureES5506(
-            filter_mode=ESFilterMode(read_byte(stream)),
-            k1=read_short(stream),
-            k2=read_short(stream),
-            env_count=read_short(stream),
-            left_volume_ramp=read_byte(stream),
-            right_volume_ramp=read_byte(stream),
-            k1_ramp=read_byte(stream),
-            k2_ramp=read_byte(stream),
-            k1_slow=read_byte(stream),
-            k2_slow=read_byte(stream),
+            filter_mode=ESFilterMode(stream.u8()),
+            k1=stream.u16(),
+            k2=stream.u16(),
+            env_count=stream.u16(),
+            left_volume_ramp=stream.u8(),
+            right_volume_ramp=stream.u8(),
+            k1_ramp=stream.u8(),
+            k2_ramp=stream.u8(),
+            k1_slow=stream.u8(),
+            k2_slow=stream.u8(),
         )
 
-    def __load_x1_block(self, stream: BytesIO) -> InsFeatureX1010:
-        return InsFeatureX1010(bank_slot=read_int(stream))
+    def __load_x1_block(self, stream: Cursor) -> InsFeatureX1010:
+        return InsFeatureX1010(bank_slot=stream.u32())
 
-    def __load_ne_block(self, stream: BytesIO) -> InsFeatureDPCMMap:
+    def __load_ne_block(self, stream: Cursor) -> InsFeatureDPCMMap:
         sm = InsFeatureDPCMMap()
 
-        sm.use_map = bool(read_byte(stream) & 1)
+        sm.use_map = bool(stream.u8() & 1)
 
         if sm.use_map:
             for i in range(len(sm.sample_map)):
-                sm.sample_map[i].pitch = read_byte(stream)
-                sm.sample_map[i].delta = read_byte(stream)
+                sm.sample_map[i].pitch = stream.u8()
+                sm.sample_map[i].delta = stream.u8()
 
         return sm
 
     # TODO: No documentation?
-    # def __load_ef_block(self, stream: BytesIO) -> InsFeatureESFM:
+    # def __load_ef_block(self, stream: Cursor) -> InsFeatureESFM:
     #    pass
 
-    def __load_pn_block(self, stream: BytesIO) -> InsFeaturePowerNoise:
-        return InsFeaturePowerNoise(octave=read_byte(stream))
+    def __load_pn_block(self, stream: Cursor) -> InsFeaturePowerNoise:
+        return InsFeaturePowerNoise(octave=stream.u8())
 
-    def __load_s2_block(self, stream: BytesIO) -> InsFeatureSID2:
-        current_byte = read_byte(stream)
+    def __load_s2_block(self, stream: Cursor) -> InsFeatureSID2:
+        current_byte = stream.u8()
         return InsFeatureSID2(
             volume=current_byte & 0b1111,
             wave_mix=(current_byte >> 4) & 0b11,
@@ -674,1074 +701,668 @@ class FurnaceInstrument:
             if release is not None and release != 0xFFFFFFFF:
                 macro.insert(release, MacroItem.RELEASE)
 
+        def read_macro_set(
+            kinds: Tuple[Union[MacroCode, OpMacroCode], ...],
+            read_values: Callable[[int], List[int]],
+        ) -> List[SingleMacro]:
+            # lengths, loops, releases and open flags of every macro come first,
+            # followed by the data of each macro
+            num_macros = len(kinds)
+            params = ins_data.unpack("<%dI%dB" % (3 * num_macros, num_macros))
+            macros: List[SingleMacro] = []
+            for i, kind in enumerate(kinds):
+                new_macro = SingleMacro(
+                    kind=kind, open=bool(params[3 * num_macros + i])
+                )
+                add_to_macro_data(
+                    new_macro.data,
+                    params[num_macros + i],
+                    params[2 * num_macros + i],
+                    read_values(params[i]),
+                )
+                macros.append(new_macro)
+            return macros
+
         # we check the header here
         if stream.read(len(EMBED_MAGIC_STR)) != EMBED_MAGIC_STR:
             raise RuntimeError("Bad magic value for a format 0 embed")
 
         blk_size = read_int(stream)
+        ins_data: Union[Cursor, StreamCursor]
         if blk_size > 0:
-            ins_data: Union[BytesIO, BinaryIO] = BytesIO(stream.read(blk_size))
+            ins_data = Cursor(stream.read(blk_size))
         else:
-            ins_data = stream
+            # no size given, so read the instrument straight from the stream
+            ins_data = StreamCursor(stream)
+
+        # these are called a lot, so keep them in locals
+        u8, u16, u32 = ins_data.u8, ins_data.u16, ins_data.u32
 
-        self.meta.version = read_short(ins_data)  # overwrites the file header version
-        self.meta.type = InstrumentType(read_byte(ins_data))
+        self.meta.version = u16()  # overwrites the file header version
+        version = self.meta.version
+        self.meta.type = InstrumentType(u8())
 
-        read_byte(ins_data)
+        ins_data.skip(1)
 
         # read all features in one go!
         self.features.clear()
+        add_feature = self.features.append
 
         # name, insert immediately
-        self.features.append(InsFeatureName(read_str(ins_data)))
+        add_feature(InsFeatureName(ins_data.cstr()))
 
         # fm
-        if True:
-            fm = InsFeatureFM(
-                alg=read_byte(ins_data),
-                fb=read_byte(ins_data),
-                fms=read_byte(ins_data),
-                ams=read_byte(ins_data),
-                ops=read_byte(ins_data),
-                opll_preset=read_byte(ins_data),
-            )
-            read_short(ins_data)
-            for i in range(4):
-                fm.op_list[i].am = bool(read_byte(ins_data))
-                fm.op_list[i].ar = read_byte(ins_data)
-                fm.op_list[i].dr = read_byte(ins_data)
-                fm.op_list[i].mult = read_byte(ins_data)
-                fm.op_list[i].rr = read_byte(ins_data)
-                fm.op_list[i].sl = read_byte(ins_data)
-                fm.op_list[i].tl = read_byte(ins_data)
-                fm.op_list[i].dt2 = read_byte(ins_data)
-                fm.op_list[i].rs = read_byte(ins_data)
-                fm.op_list[i].dt = read_byte(ins_data)
-                fm.op_list[i].d2r = read_byte(ins_data)
-                fm.op_list[i].ssg_env = read_byte(ins_data)
-                fm.op_list[i].dam = read_byte(ins_data)
-                fm.op_list[i].dvb = read_byte(ins_data)
-                fm.op_list[i].egt = bool(read_byte(ins_data))
-                fm.op_list[i].ksl = read_byte(ins_data)
-                fm.op_list[i].sus = bool(read_byte(ins_data))
-                fm.op_list[i].vib = bool(read_byte(ins_data))
-                fm.op_list[i].ws = read_byte(ins_data)
-                fm.op_list[i].ksr = bool(read_byte(ins_data))
-                en = read_byte(ins_data)
-                if self.meta.version >= 114:
-                    fm.op_list[i].enable = bool(en)
-                kvs = read_byte(ins_data)
-                if self.meta.version >= 115:
-                    fm.op_list[i].kvs = kvs
-                ins_data.read(10)
-            self.features.append(fm)
+        fm = InsFeatureFM(
+            alg=u8(),
+            fb=u8(),
+            fms=u8(),
+            ams=u8(),
+            ops=u8(),
+            opll_preset=u8(),
+        )
+        ins_data.skip(2)
+        for op in fm.op_list:
+            (
+                op_am,
+                op.ar,
+                op.dr,
+                op.mult,
+                op.rr,
+                op.sl,
+                op.tl,
+                op.dt2,
+                op.rs,
+                op.dt,
+                op.d2r,
+                op.ssg_env,
+                op.dam,
+                op.dvb,
+                op_egt,
+                op.ksl,
+                op_sus,
+                op_vib,
+                op.ws,
+                op_ksr,
+                op_en,
+                op_kvs,
+            ) = ins_data.unpack(FM_OP_PARAMS)
+            op.am = bool(op_am)
+            op.egt = bool(op_egt)
+            op.sus = bool(op_sus)
+            op.vib = bool(op_vib)
+            op.ksr = bool(op_ksr)
+            if version >= 114:
+                op.enable = bool(op_en)
+            if version >= 115:
+                op.kvs = op_kvs
+        add_feature(fm)
 
         # gameboy
-        if True:
-            gb = InsFeatureGB(
-                env_vol=read_byte(ins_data),
-                env_dir=read_byte(ins_data),
-                env_len=read_byte(ins_data),
-                sound_len=read_byte(ins_data),
-            )
-            self.features.append(gb)
+        gb = InsFeatureGB(
+            env_vol=u8(),
+            env_dir=u8(),
+            env_len=u8(),
+            sound_len=u8(),
+        )
+        add_feature(gb)
 
         # c64
-        if True:
-            c64 = InsFeatureC64(
-                tri_on=bool(read_byte(ins_data)),
-                saw_on=bool(read_byte(ins_data)),
-                pulse_on=bool(read_byte(ins_data)),
-                noise_on=bool(read_byte(ins_data)),
-                duty=read_short(ins_data),
-                ring_mod=read_byte(ins_data),
-                osc_sync=read_byte(ins_data),
-                to_filter=bool(read_byte(ins_data)),
-                init_filter=bool(read_byte(ins_data)),
-                vol_is_cutoff=bool(read_byte(ins_data)),
-                res=read_byte(ins_data),
-                lp=bool(read_byte(ins_data)),
-                bp=bool(read_byte(ins_data)),
-                hp=bool(read_byte(ins_data)),
-                ch3_off=bool(read_byte(ins_data)),
-                cut=read_short(ins_data),
-                duty_is_abs=bool(read_byte(ins_data)),
-                filter_is_abs=bool(read_byte(ins_data)),
-            )
-            c64.envelope = GenericADSR(
-                a=read_byte(ins_data),
-                d=read_byte(ins_data),
-                s=read_byte(ins_data),
-                r=read_byte(ins_data),
-            )
-            self.features.append(c64)
+        (
+            c64_tri_on,
+            c64_saw_on,
+            c64_pulse_on,
+            c64_noise_on,
+            c64_duty,
+            c64_ring_mod,
+            c64_osc_sync,
+            c64_to_filter,
+            c64_init_filter,
+            c64_vol_is_cutoff,
+            c64_res,
+            c64_lp,
+            c64_bp,
+            c64_hp,
+            c64_ch3_off,
+            c64_cut,
+            c64_duty_is_abs,
+            c64_filter_is_abs,
+            c64_a,
+            c64_d,
+            c64_s,
+            c64_r,
+        ) = ins_data.unpack(C64_PARAMS)
+        c64 = InsFeatureC64(
+            tri_on=c64_tri_on != 0,
+            saw_on=c64_saw_on != 0,
+            pulse_on=c64_pulse_on != 0,
+            noise_on=c64_noise_on != 0,
+            duty=c64_duty,
+            ring_mod=c64_ring_mod,
+            osc_sync=c64_osc_sync,
+            to_filter=c64_to_filter != 0,
+            init_filter=c64_init_filter != 0,
+            vol_is_cutoff=c64_vol_is_cutoff != 0,
+            res=c64_res,
+            lp=c64_lp != 0,
+            bp=c64_bp != 0,
+            hp=c64_hp != 0,
+            ch3_off=c64_ch3_off != 0,
+            cut=c64_cut,
+            duty_is_abs=c64_duty_is_abs != 0,
+            filter_is_abs=c64_filter_is_abs != 0,
+        )
+        c64.envelope = GenericADSR(a=c64_a, d=c64_d, s=c64_s, r=c64_r)
+        add_feature(c64)
 
         # amiga
-        if True:
-            amiga = InsFeatureAmiga(init_sample=read_short(ins_data))
+        amiga = InsFeatureAmiga(init_sample=u16())
 
-            wave = read_byte(ins_data)
-            wavelen = read_byte(ins_data)
-            if self.meta.version >= 82:
-                amiga.use_wave = bool(wave)
-                amiga.wave_len = wavelen
+        wave = u8()
+        wavelen = u8()
+        if version >= 82:
+            amiga.use_wave = bool(wave)
+            amiga.wave_len = wavelen
 
-            for _ in range(12):
-                read_byte(ins_data)  # reserved
+        ins_data.skip(12)  # reserved
 
-            self.features.append(amiga)
+        add_feature(amiga)
 
         # standard
-        if True:
-            mac = InsFeatureMacro()
-
-            vol_mac = SingleMacro(kind=MacroCode.VOL)
-            arp_mac = SingleMacro(kind=MacroCode.ARP)
-            duty_mac = SingleMacro(kind=MacroCode.DUTY)
-            wave_mac = SingleMacro(kind=MacroCode.WAVE)
-
-            vol_mac.data.clear()
-            arp_mac.data.clear()
-            duty_mac.data.clear()
-            wave_mac.data.clear()
-
-            mac_list: List[SingleMacro] = [vol_mac, arp_mac, duty_mac, wave_mac]
-            mac.macros = mac_list
-
-            vol_mac_len = read_int(ins_data)
-            arp_mac_len = read_int(ins_data)
-            duty_mac_len = read_int(ins_data)
-            wave_mac_len = read_int(ins_data)
-
-            if self.meta.version >= 17:
-                pitch_mac = SingleMacro(kind=MacroCode.PITCH)
-                x1_mac = SingleMacro(kind=MacroCode.EX1)
-                x2_mac = SingleMacro(kind=MacroCode.EX2)
-                x3_mac = SingleMacro(kind=MacroCode.EX3)
-
-                pitch_mac.data.clear()
-                x1_mac.data.clear()
-                x2_mac.data.clear()
-                x3_mac.data.clear()
-
-                mac_list.extend([pitch_mac, x1_mac, x2_mac, x3_mac])
-
-                pitch_mac_len = read_int(ins_data)
-                x1_mac_len = read_int(ins_data)
-                x2_mac_len = read_int(ins_data)
-                x3_mac_len = read_int(ins_data)
+        mac = InsFeatureMacro()
+
+        vol_mac = SingleMacro(kind=MacroCode.VOL)
+        arp_mac = SingleMacro(kind=MacroCode.ARP)
+        duty_mac = SingleMacro(kind=MacroCode.DUTY)
+        wave_mac = SingleMacro(kind=MacroCode.WAVE)
+
+        mac_list: List[SingleMacro] = [vol_mac, arp_mac, duty_mac, wave_mac]
+        mac.macros = mac_list
+
+        vol_mac_len = u32()
+        arp_mac_len = u32()
+        duty_mac_len = u32()
+        wave_mac_len = u32()
+
+        if version >= 17:
+            pitch_mac = SingleMacro(kind=MacroCode.PITCH)
+            x1_mac = SingleMacro(kind=MacroCode.EX1)
+            x2_mac = SingleMacro(kind=MacroCode.EX2)
+            x3_mac = SingleMacro(kind=MacroCode.EX3)
+
+            mac_list.extend([pitch_mac, x1_mac, x2_mac, x3_mac])
+
+            pitch_mac_len = u32()
+            x1_mac_len = u32()
+            x2_mac_len = u32()
+            x3_mac_len = u32()
+
+        vol_mac_loop = u32()
+        arp_mac_loop = u32()
+        duty_mac_loop = u32()
+        wave_mac_loop = u32()
+
+        if version >= 17:
+            pitch_mac_loop = u32()
+            x1_mac_loop = u32()
+            x2_mac_loop = u32()
+            x3_mac_loop = u32()
+
+        arp_mac_mode = u8()
+        old_vol_height = u8()
+        old_duty_height = u8()
+
+        ins_data.skip(1)
+
+        add_to_macro_data(
+            vol_mac.data,
+            loop=vol_mac_loop,
+            release=None,
+            data=ins_data.u32s(vol_mac_len),
+        )
 
-            vol_mac_loop = read_int(ins_data)
-            arp_mac_loop = read_int(ins_data)
-            duty_mac_loop = read_int(ins_data)
-            wave_mac_loop = read_int(ins_data)
+        add_to_macro_data(
+            arp_mac.data,
+            loop=arp_mac_loop,
+            release=None,
+            data=ins_data.u32s(arp_mac_len),
+        )
 
-            if self.meta.version >= 17:
-                pitch_mac_loop = read_int(ins_data)
-                x1_mac_loop = read_int(ins_data)
-                x2_mac_loop = read_int(ins_data)
-                x3_mac_loop = read_int(ins_data)
+        add_to_macro_data(
+            duty_mac.data,
+            loop=duty_mac_loop,
+            release=None,
+            data=ins_data.u32s(duty_mac_len),
+        )
 
-            arp_mac_mode = read_byte(ins_data)
-            old_vol_height = read_byte(ins_data)
-            old_duty_height = read_byte(ins_data)
+        add_to_macro_data(
+            wave_mac.data,
+            loop=wave_mac_loop,
+            release=None,
+            data=ins_data.u32s(wave_mac_len),
+        )
 
-            read_byte(ins_data)
+        # adjust values
+        if version < 31:
+            if arp_mac_mode == 0:
+                arp_mac.data[:] = [
+                    x - 12 if isinstance(x, int) else x for x in arp_mac.data
+                ]
+        if version < 87:
+            if c64.vol_is_cutoff and not c64.filter_is_abs:
+                vol_mac.data[:] = [
+                    x - 18 if isinstance(x, int) else x for x in vol_mac.data
+                ]
+            if c64.duty_is_abs:  # TODO
+                duty_mac.data[:] = [
+                    x - 12 if isinstance(x, int) else x for x in duty_mac.data
+                ]
+        if version < 112:
+            if arp_mac_mode == 1:  # fixed arp!
+                arp_mac.data[:] = [
+                    x | (1 << 30) if isinstance(x, int) else x for x in arp_mac.data
+                ]
+                if len(arp_mac.data) > 0:
+                    if arp_mac_loop != 0xFFFFFFFF:
+                        if arp_mac_loop == arp_mac_len + 1:
+                            arp_mac.data[-1] = 0
+                            arp_mac.data.append(MacroItem.LOOP)
+                        elif arp_mac_loop == arp_mac_len:
+                            arp_mac.data.append(0)
+                else:
+                    arp_mac.data.append(0)
 
+        # read more macros
+        if version >= 17:
             add_to_macro_data(
-                vol_mac.data,
-                loop=vol_mac_loop,
+                pitch_mac.data,
+                loop=pitch_mac_loop,
                 release=None,
-                data=[read_int(ins_data) for _ in range(vol_mac_len)],
+                data=ins_data.u32s(pitch_mac_len),
             )
 
             add_to_macro_data(
-                arp_mac.data,
-                loop=arp_mac_loop,
+                x1_mac.data,
+                loop=x1_mac_loop,
                 release=None,
-                data=[read_int(ins_data) for _ in range(arp_mac_len)],
+                data=ins_data.u32s(x1_mac_len),
             )
 
             add_to_macro_data(
-                duty_mac.data,
-                loop=duty_mac_loop,
+                x2_mac.data,
+                loop=x2_mac_loop,
                 release=None,
-                data=[read_int(ins_data) for _ in range(duty_mac_len)],
+                data=ins_data.u32s(x2_mac_len),
             )
 
             add_to_macro_data(
-                wave_mac.data,
-                loop=wave_mac_loop,
+                x3_mac.data,
+                loop=x3_mac_loop,
                 release=None,
-                data=[read_int(ins_data) for _ in range(wave_mac_len)],
+                data=ins_data.u32s(x3_mac_len),
             )
+        else:
+            if self.meta.type == InstrumentType.STANDARD:
+                if old_vol_height == 31:
+                    self.meta.type = InstrumentType.PCE
+                elif old_duty_height == 31:
+                    self.meta.type = InstrumentType.SSG
 
-            # adjust values
-            if self.meta.version < 31:
-                if arp_mac_mode == 0:
-                    for j in range(len(arp_mac.data)):
-                        if isinstance(arp_mac.data[j], int):
-                            arp_mac.data[j] = cast(int, arp_mac.data[j]) - 12
-            if self.meta.version < 87:
-                if c64.vol_is_cutoff and not c64.filter_is_abs:
-                    for j in range(len(vol_mac.data)):
-                        if isinstance(vol_mac.data[j], int):
-                            vol_mac.data[j] = cast(int, vol_mac.data[j]) - 18
-                if c64.duty_is_abs:  # TODO
-                    for j in range(len(duty_mac.data)):
-                        if isinstance(duty_mac.data[j], int):
-                            duty_mac.data[j] = cast(int, duty_mac.data[j]) - 12
-            if self.meta.version < 112:
-                if arp_mac_mode == 1:  # fixed arp!
-                    for i in range(len(arp_mac.data)):
-                        if isinstance(arp_mac.data[i], int):
-                            arp_mac.data[i] = cast(int, arp_mac.data[i]) | (1 << 30)
-                    if len(arp_mac.data) > 0:
-                        if arp_mac_loop != 0xFFFFFFFF:
-                            if arp_mac_loop == arp_mac_len + 1:
-                                arp_mac.data[-1] = 0
-                                arp_mac.data.append(MacroItem.LOOP)
-                            elif arp_mac_loop == arp_mac_len:
-                                arp_mac.data.append(0)
-                    else:
-                        arp_mac.data.append(0)
-
-            # read more macros
-            if self.meta.version >= 17:
-                add_to_macro_data(
-                    pitch_mac.data,
-                    loop=pitch_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(pitch_mac_len)],
-                )
-
-                add_to_macro_data(
-                    x1_mac.data,
-                    loop=x1_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(x1_mac_len)],
-                )
-
-                add_to_macro_data(
-                    x2_mac.data,
-                    loop=x2_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(x2_mac_len)],
-                )
-
-                add_to_macro_data(
-                    x3_mac.data,
-                    loop=x3_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(x3_mac_len)],
-                )
-            else:
-                if self.meta.type == InstrumentType.STANDARD:
-                    if old_vol_height == 31:
-                        self.meta.type = InstrumentType.PCE
-                    elif old_duty_height == 31:
-                        self.meta.type = InstrumentType.SSG
-
-            self.features.append(mac)
+        add_feature(mac)
 
         # fm macros
-        if True:
-            if self.meta.version >= 29:
-                alg_mac = SingleMacro(kind=MacroCode.ALG)
-                fb_mac = SingleMacro(kind=MacroCode.FB)
-                fms_mac = SingleMacro(kind=MacroCode.FMS)
-                ams_mac = SingleMacro(kind=MacroCode.AMS)
-                mac_list.extend([alg_mac, fb_mac, fms_mac, ams_mac])
-
-                alg_mac.data.clear()
-                fb_mac.data.clear()
-                fms_mac.data.clear()
-                ams_mac.data.clear()
-
-                alg_mac_len = read_int(ins_data)
-                fb_mac_len = read_int(ins_data)
-                fms_mac_len = read_int(ins_data)
-                ams_mac_len = read_int(ins_data)
-
-                alg_mac_loop = read_int(ins_data)
-                fb_mac_loop = read_int(ins_data)
-                fms_mac_loop = read_int(ins_data)
-                ams_mac_loop = read_int(ins_data)
-
-                vol_mac.open = bool(read_byte(ins_data))
-                arp_mac.open = bool(read_byte(ins_data))
-                duty_mac.open = bool(read_byte(ins_data))
-                wave_mac.open = bool(read_byte(ins_data))
-                pitch_mac.open = bool(read_byte(ins_data))
-                x1_mac.open = bool(read_byte(ins_data))
-                x2_mac.open = bool(read_byte(ins_data))
-                x3_mac.open = bool(read_byte(ins_data))
-
-                alg_mac.open = bool(read_byte(ins_data))
-                fb_mac.open = bool(read_byte(ins_data))
-                fms_mac.open = bool(read_byte(ins_data))
-                ams_mac.open = bool(read_byte(ins_data))
+        if version >= 29:
+            alg_mac = SingleMacro(kind=MacroCode.ALG)
+            fb_mac = SingleMacro(kind=MacroCode.FB)
+            fms_mac = SingleMacro(kind=MacroCode.FMS)
+            ams_mac = SingleMacro(kind=MacroCode.AMS)
+            mac_list.extend([alg_mac, fb_mac, fms_mac, ams_mac])
+
+            alg_mac_len = u32()
+            fb_mac_len = u32()
+            fms_mac_len = u32()
+            ams_mac_len = u32()
+
+            alg_mac_loop = u32()
+            fb_mac_loop = u32()
+            fms_mac_loop = u32()
+            ams_mac_loop = u32()
+
+            (
+                vol_mac.open,
+                arp_mac.open,
+                duty_mac.open,
+                wave_mac.open,
+                pitch_mac.open,
+                x1_mac.open,
+                x2_mac.open,
+                x3_mac.open,
+                alg_mac.open,
+                fb_mac.open,
+                fms_mac.open,
+                ams_mac.open,
+            ) = map(bool, ins_data.unpack("<12B"))
 
-                add_to_macro_data(
-                    alg_mac.data,
-                    loop=alg_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(alg_mac_len)],
-                )
+            add_to_macro_data(
+                alg_mac.data,
+                loop=alg_mac_loop,
+                release=None,
+                data=ins_data.u32s(alg_mac_len),
+            )
 
-                add_to_macro_data(
-                    fb_mac.data,
-                    loop=fb_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(fb_mac_len)],
-                )
+            add_to_macro_data(
+                fb_mac.data,
+                loop=fb_mac_loop,
+                release=None,
+                data=ins_data.u32s(fb_mac_len),
+            )
 
-                add_to_macro_data(
-                    fms_mac.data,
-                    loop=fms_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(fms_mac_len)],
-                )
+            add_to_macro_data(
+                fms_mac.data,
+                loop=fms_mac_loop,
+                release=None,
+                data=ins_data.u32s(fms_mac_len),
+            )
 
-                add_to_macro_data(
-                    ams_mac.data,
-                    loop=ams_mac_loop,
-                    release=None,
-                    data=[read_int(ins_data) for _ in range(ams_mac_len)],
-                )
+            add_to_macro_data(
+                ams_mac.data,
+                loop=ams_mac_loop,
+                release=None,
+                data=ins_data.u32s(ams_mac_len),
+            )
 
         # fm op macros
-        if True:
-            if self.meta.version >= 29:
-                new_ops: Dict[int, InsFeatureMacro] = {}  # actual ops
-
-                ops_types: Dict[int, Type[InsFeatureMacro]] = {  # classes
-                    0: InsFeatureOpr1Macro,
-                    1: InsFeatureOpr2Macro,
-                    2: InsFeatureOpr3Macro,
-                    3: InsFeatureOpr4Macro,
-                }
-
-                ops: Dict[int, Dict[str, Union[int, bool]]] = {  # params
-                    0: {},
-                    1: {},
-                    2: {},
-                    3: {},
-                }
-
-                for opi in ops:
-                    ops[opi]["am_mac_len"] = read_int(ins_data)
-                    ops[opi]["ar_mac_len"] = read_int(ins_data)
-                    ops[opi]["dr_mac_len"] = read_int(ins_data)
-                    ops[opi]["mult_mac_len"] = read_int(ins_data)
-                    ops[opi]["rr_mac_len"] = read_int(ins_data)
-                    ops[opi]["sl_mac_len"] = read_int(ins_data)
-                    ops[opi]["tl_mac_len"] = read_int(ins_data)
-                    ops[opi]["dt2_mac_len"] = read_int(ins_data)
-                    ops[opi]["rs_mac_len"] = read_int(ins_data)
-                    ops[opi]["dt_mac_len"] = read_int(ins_data)
-                    ops[opi]["d2r_mac_len"] = read_int(ins_data)
-                    ops[opi]["ssg_mac_len"] = read_int(ins_data)
-
-                    ops[opi]["am_mac_loop"] = read_int(ins_data)
-                    ops[opi]["ar_mac_loop"] = read_int(ins_data)
-                    ops[opi]["dr_mac_loop"] = read_int(ins_data)
-                    ops[opi]["mult_mac_loop"] = read_int(ins_data)
-                    ops[opi]["rr_mac_loop"] = read_int(ins_data)
-                    ops[opi]["sl_mac_loop"] = read_int(ins_data)
-                    ops[opi]["tl_mac_loop"] = read_int(ins_data)
-                    ops[opi]["dt2_mac_loop"] = read_int(ins_data)
-                    ops[opi]["rs_mac_loop"] = read_int(ins_data)
-                    ops[opi]["dt_mac_loop"] = read_int(ins_data)
-                    ops[opi]["d2r_mac_loop"] = read_int(ins_data)
-                    ops[opi]["ssg_mac_loop"] = read_int(ins_data)
-
-                    ops[opi]["am_mac_open"] = read_byte(ins_data)
-                    ops[opi]["ar_mac_open"] = read_byte(ins_data)
-                    ops[opi]["dr_mac_open"] = read_byte(ins_data)
-                    ops[opi]["mult_mac_open"] = read_byte(ins_data)
-                    ops[opi]["rr_mac_open"] = read_byte(ins_data)
-                    ops[opi]["sl_mac_open"] = read_byte(ins_data)
-                    ops[opi]["tl_mac_open"] = read_byte(ins_data)
-                    ops[opi]["dt2_mac_open"] = read_byte(ins_data)
-                    ops[opi]["rs_mac_open"] = read_byte(ins_data)
-                    ops[opi]["dt_mac_open"] = read_byte(ins_data)
-                    ops[opi]["d2r_mac_open"] = read_byte(ins_data)
-                    ops[opi]["ssg_mac_open"] = read_byte(ins_data)
-
-                for opi in ops:
-                    new_op = ops_types[opi]()
-                    new_op.macros = []
-
-                    am_mac = SingleMacro(kind=OpMacroCode.AM)
-                    am_mac.open = bool(ops[opi]["am_mac_open"])
-                    am_mac.data.clear()
-                    add_to_macro_data(
-                        am_mac.data,
-                        loop=ops[opi]["am_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["am_mac_len"])
-                        ],
-                    )
-
-                    ar_mac = SingleMacro(kind=OpMacroCode.AR)
-                    ar_mac.open = bool(ops[opi]["ar_mac_open"])
-                    ar_mac.data.clear()
-                    add_to_macro_data(
-                        ar_mac.data,
-                        loop=ops[opi]["ar_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["ar_mac_len"])
-                        ],
-                    )
-
-                    dr_mac = SingleMacro(kind=OpMacroCode.DR)
-                    dr_mac.open = bool(ops[opi]["dr_mac_open"])
-                    dr_mac.data.clear()
-                    add_to_macro_data(
-                        dr_mac.data,
-                        loop=ops[opi]["dr_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["dr_mac_len"])
-                        ],
-                    )
-
-                    mult_mac = SingleMacro(kind=OpMacroCode.MULT)
-                    mult_mac.open = bool(ops[opi]["mult_mac_open"])
-                    mult_mac.data.clear()
-                    add_to_macro_data(
-                        mult_mac.data,
-                        loop=ops[opi]["mult_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["mult_mac_len"])
-                        ],
-                    )
-
-                    rr_mac = SingleMacro(kind=OpMacroCode.RR)
-                    rr_mac.open = bool(ops[opi]["rr_mac_open"])
-                    rr_mac.data.clear()
-                    add_to_macro_data(
-                        rr_mac.data,
-                        loop=ops[opi]["rr_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["rr_mac_len"])
-                        ],
-                    )
-
-                    sl_mac = SingleMacro(kind=OpMacroCode.SL)
-                    sl_mac.open = bool(ops[opi]["sl_mac_open"])
-                    sl_mac.data.clear()
-                    add_to_macro_data(
-                        sl_mac.data,
-                        loop=ops[opi]["sl_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["sl_mac_len"])
-                        ],
-                    )
-
-                    tl_mac = SingleMacro(kind=OpMacroCode.TL)
-                    tl_mac.open = bool(ops[opi]["tl_mac_open"])
-                    tl_mac.data.clear()
-                    add_to_macro_data(
-                        tl_mac.data,
-                        loop=ops[opi]["tl_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["tl_mac_len"])
-                        ],
-                    )
+        if version >= 29:
+            new_ops: List[InsFeatureMacro] = []  # actual ops
 
-                    dt2_mac = SingleMacro(kind=OpMacroCode.DT2)
-                    dt2_mac.open = bool(ops[opi]["dt2_mac_open"])
-                    dt2_mac.data.clear()
-                    add_to_macro_data(
-                        dt2_mac.data,
-                        loop=ops[opi]["dt2_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["dt2_mac_len"])
-                        ],
-                    )
-
-                    rs_mac = SingleMacro(kind=OpMacroCode.RS)
-                    rs_mac.open = bool(ops[opi]["rs_mac_open"])
-                    rs_mac.data.clear()
-                    add_to_macro_data(
-                        rs_mac.data,
-                        loop=ops[opi]["rs_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["rs_mac_len"])
-                        ],
-                    )
+            ops_types: Tuple[Type[InsFeatureMacro], ...] = (  # classes
+                InsFeatureOpr1Macro,
+                InsFeatureOpr2Macro,
+                InsFeatureOpr3Macro,
+                InsFeatureOpr4Macro,
+            )
 
-                    dt_mac = SingleMacro(kind=OpMacroCode.DT)
-                    dt_mac.open = bool(ops[opi]["dt_mac_open"])
-                    dt_mac.data.clear()
-                    add_to_macro_data(
-                        dt_mac.data,
-                        loop=ops[opi]["dt_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["dt_mac_len"])
-                        ],
-                    )
+            op_kinds = (  # must be in order!!
+                OpMacroCode.AM,
+                OpMacroCode.AR,
+                OpMacroCode.DR,
+                OpMacroCode.MULT,
+                OpMacroCode.RR,
+                OpMacroCode.SL,
+                OpMacroCode.TL,
+                OpMacroCode.DT2,
+                OpMacroCode.RS,
+                OpMacroCode.DT,
+                OpMacroCode.D2R,
+                OpMacroCode.SSG_EG,
+            )
 
-                    d2r_mac = SingleMacro(kind=OpMacroCode.D2R)
-                    d2r_mac.open = bool(ops[opi]["d2r_mac_open"])
-                    d2r_mac.data.clear()
-                    add_to_macro_data(
-                        d2r_mac.data,
-                        loop=ops[opi]["d2r_mac_loop"],
-                        release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["d2r_mac_len"])
-                        ],
-                    )
+            # lengths, loops and open flags of all ops come before any macro data
+            ops_params = [ins_data.unpack("<24I12B") for _ in ops_types]
 
-                    ssg_mac = SingleMacro(kind=OpMacroCode.SSG_EG)
-                    ssg_mac.open = bool(ops[opi]["ssg_mac_open"])
-                    ssg_mac.data.clear()
+            for op_type, params in zip(ops_types, ops_params):
+                new_op = op_type()
+                new_op.macros = []
+                for i, kind in enumerate(op_kinds):
+                    op_mac = SingleMacro(kind=kind, open=bool(params[24 + i]))
                     add_to_macro_data(
-                        ssg_mac.data,
-                        loop=ops[opi]["ssg_mac_loop"],
+                        op_mac.data,
+                        loop=params[12 + i],
                         release=None,
-                        data=[
-                            read_int(ins_data) for _ in range(ops[opi]["ssg_mac_len"])
-                        ],
+                        data=ins_data.u32s(params[i]),
                     )
-
-                    new_op.macros.extend(
-                        [
-                            am_mac,
-                            ar_mac,
-                            dr_mac,
-                            mult_mac,
-                            rr_mac,
-                            sl_mac,
-                            tl_mac,
-                            dt2_mac,
-                            rs_mac,
-                            dt_mac,
-                            d2r_mac,
-                            ssg_mac,
-                        ]
-                    )  # must be in order!!
-
-                    new_ops[opi] = new_op
+                    new_op.macros.append(op_mac)
+                new_ops.append(new_op)
 
         # release points
-        if True:
-            if self.meta.version >= 44:
-                add_to_macro_data(vol_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(arp_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(duty_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(wave_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(pitch_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(x1_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(x2_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(x3_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(alg_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(fb_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(fms_mac.data, None, read_int(ins_data), None)
-                add_to_macro_data(ams_mac.data, None, read_int(ins_data), None)
-
-                for opi in new_ops:
-                    for i in range(12):
-                        add_to_macro_data(
-                            new_ops[opi].macros[i].data, None, read_int(ins_data), None
-                        )
-
-        # extended op macros
-        if True:
-            if self.meta.version >= 61:
-                for op in new_ops:
-                    dam_mac = SingleMacro(kind=OpMacroCode.DAM)
-                    dvb_mac = SingleMacro(kind=OpMacroCode.DVB)
-                    egt_mac = SingleMacro(kind=OpMacroCode.EGT)
-                    ksl_mac = SingleMacro(kind=OpMacroCode.KSL)
-                    sus_mac = SingleMacro(kind=OpMacroCode.SUS)
-                    vib_mac = SingleMacro(kind=OpMacroCode.VIB)
-                    ws_mac = SingleMacro(kind=OpMacroCode.WS)
-                    ksr_mac = SingleMacro(kind=OpMacroCode.KSR)
-
-                    dam_mac_len = read_int(ins_data)
-                    dvb_mac_len = read_int(ins_data)
-                    egt_mac_len = read_int(ins_data)
-                    ksl_mac_len = read_int(ins_data)
-                    sus_mac_len = read_int(ins_data)
-                    vib_mac_len = read_int(ins_data)
-                    ws_mac_len = read_int(ins_data)
-                    ksr_mac_len = read_int(ins_data)
-
-                    dam_mac_loop = read_int(ins_data)
-                    dvb_mac_loop = read_int(ins_data)
-                    egt_mac_loop = read_int(ins_data)
-                    ksl_mac_loop = read_int(ins_data)
-                    sus_mac_loop = read_int(ins_data)
-                    vib_mac_loop = read_int(ins_data)
-                    ws_mac_loop = read_int(ins_data)
-                    ksr_mac_loop = read_int(ins_data)
-
-                    dam_mac_rel = read_int(ins_data)
-                    dvb_mac_rel = read_int(ins_data)
-                    egt_mac_rel = read_int(ins_data)
-                    ksl_mac_rel = read_int(ins_data)
-                    sus_mac_rel = read_int(ins_data)
-                    vib_mac_rel = read_int(ins_data)
-                    ws_mac_rel = read_int(ins_data)
-                    ksr_mac_rel = read_int(ins_data)
-
-                    dam_mac.open = bool(read_byte(ins_data))
-                    dvb_mac.open = bool(read_byte(ins_data))
-                    egt_mac.open = bool(read_byte(ins_data))
-                    ksl_mac.open = bool(read_byte(ins_data))
-                    sus_mac.open = bool(read_byte(ins_data))
-                    vib_mac.open = bool(read_byte(ins_data))
-                    ws_mac.open = bool(read_byte(ins_data))
-                    ksr_mac.open = bool(read_byte(ins_data))
-
-                    dam_mac.data.clear()
-                    dvb_mac.data.clear()
-                    egt_mac.data.clear()
-                    ksl_mac.data.clear()
-                    sus_mac.data.clear()
-                    vib_mac.data.clear()
-                    ws_mac.data.clear()
-                    ksr_mac.data.clear()
+        if version >= 44:
+            for std_mac in mac_list:
+                add_to_macro_data(std_mac.data, None, u32(), None)
 
-                    add_to_macro_data(
-                        dam_mac.data,
-                        dam_mac_loop,
-                        dam_mac_rel,
-                        [read_byte(ins_data) for _ in range(dam_mac_len)],
-                    )
-                    add_to_macro_data(
-                        dvb_mac.data,
-                        dvb_mac_loop,
-                        dvb_mac_rel,
-                        [read_byte(ins_data) for _ in range(dvb_mac_len)],
-                    )
-                    add_to_macro_data(
-                        egt_mac.data,
-                        egt_mac_loop,
-                        egt_mac_rel,
-                        [read_byte(ins_data) for _ in range(egt_mac_len)],
-                    )
-                    add_to_macro_data(
-                        ksl_mac.data,
-                        ksl_mac_loop,
-                        ksl_mac_rel,
-                        [read_byte(ins_data) for _ in range(ksl_mac_len)],
-                    )
-                    add_to_macro_data(
-                        sus_mac.data,
-                        sus_mac_loop,
-                        sus_mac_rel,
-                        [read_byte(ins_data) for _ in range(sus_mac_len)],
-                    )
-                    add_to_macro_data(
-                        vib_mac.data,
-                        vib_mac_loop,
-                        vib_mac_rel,
-                        [read_byte(ins_data) for _ in range(vib_mac_len)],
-                    )
-                    add_to_macro_data(
-                        ws_mac.data,
-                        ws_mac_loop,
-                        ws_mac_rel,
-                        [read_byte(ins_data) for _ in range(ws_mac_len)],
-                    )
-                    add_to_macro_data(
-                        ksr_mac.data,
-                        ksr_mac_loop,
-                        ksr_mac_rel,
-                        [read_byte(ins_data) for _ in range(ksr_mac_len)],
-                    )
+            for new_op in new_ops:
+                for op_mac in new_op.macros:
+                    add_to_macro_data(op_mac.data, None, u32(), None)
 
-                    new_ops[op].macros.extend(
-                        [
-                            dam_mac,
-                            dvb_mac,
-                            egt_mac,
-                            ksl_mac,
-                            sus_mac,
-                            vib_mac,
-                            ws_mac,
-                            ksr_mac,
-                        ]
-                    )
+        # extended op macros
+        if version >= 61:
+            ext_op_kinds = (
+                OpMacroCode.DAM,
+                OpMacroCode.DVB,
+                OpMacroCode.EGT,
+                OpMacroCode.KSL,
+                OpMacroCode.SUS,
+                OpMacroCode.VIB,
+                OpMacroCode.WS,
+                OpMacroCode.KSR,
+            )
+            for new_op in new_ops:
+                new_op.macros.extend(read_macro_set(ext_op_kinds, ins_data.u8s))
 
         # opl drum data
-        if True:
-            if self.meta.version >= 63:
-                opl_drum = InsFeatureOPLDrums(fixed_drums=bool(read_byte(ins_data)))
-                read_byte(ins_data)
-                opl_drum.kick_freq = read_short(ins_data)
-                opl_drum.snare_hat_freq = read_short(ins_data)
-                opl_drum.tom_top_freq = read_short(ins_data)
-                self.features.append(opl_drum)
+        if version >= 63:
+            opl_drum = InsFeatureOPLDrums(fixed_drums=bool(u8()))
+            ins_data.skip(1)
+            opl_drum.kick_freq = u16()
+            opl_drum.snare_hat_freq = u16()
+            opl_drum.tom_top_freq = u16()
+            add_feature(opl_drum)
 
         # clear macros
-        if True:
-            if self.meta.version < 63 and self.meta.type == InstrumentType.PCE:
-                duty_mac.data.clear()
-            if self.meta.version < 70 and self.meta.type == InstrumentType.FM_OPLL:
-                wave_mac.data.clear()
+        if version < 63 and self.meta.type == InstrumentType.PCE:
+            duty_mac.data.clear()
+        if version < 70 and self.meta.type == InstrumentType.FM_OPLL:
+            wave_mac.data.clear()
 
         # sample map
-        if True:
-            if self.meta.version >= 67:
-                note_map = InsFeatureAmiga()
-                note_map.use_note_map = bool(read_byte(ins_data))
-                if note_map.use_note_map:
-                    for i in range(len(note_map.sample_map)):
-                        note_map.sample_map[i].freq = read_int(ins_data)
-                    for i in range(len(note_map.sample_map)):
-                        note_map.sample_map[i].sample_index = read_short(ins_data)
-                self.features.append(note_map)
+        if version >= 67:
+            note_map = InsFeatureAmiga()
+            note_map.use_note_map = bool(u8())
+            if note_map.use_note_map:
+                num_entries = len(note_map.sample_map)
+                freqs = ins_data.unpack("<%dI" % num_entries)
+                indices = ins_data.unpack("<%dH" % num_entries)
+                for entry, freq, sample_index in zip(
+                    note_map.sample_map, freqs, indices
+                ):
+                    entry.freq = freq
+                    entry.sample_index = sample_index
+            add_feature(note_map)
 
         # n163
-        if True:
-            if self.meta.version >= 73:
-                n163 = InsFeatureN163(
-                    wave=read_int(ins_data),
-                    wave_pos=read_byte(ins_data),
-                    wave_len=read_byte(ins_data),
-                    wave_mode=read_byte(ins_data),
-                )
-                read_byte(ins_data)  # reserved
-                self.features.append(n163)
+        if version >= 73:
+            n163 = InsFeatureN163(
+                wave=u32(),
+                wave_pos=u8(),
+                wave_len=u8(),
+                wave_mode=u8(),
+            )
+            ins_data.skip(1)  # reserved
+            add_feature(n163)
 
         # moar macroes
-        if True:
-            if self.meta.version >= 76:
-                pan_l_mac = SingleMacro(kind=MacroCode.PAN_L)
-                pan_r_mac = SingleMacro(kind=MacroCode.PAN_R)
-                phase_res_mac = SingleMacro(kind=MacroCode.PHASE_RESET)
-                x4_mac = SingleMacro(kind=MacroCode.EX4)
-                x5_mac = SingleMacro(kind=MacroCode.EX5)
-                x6_mac = SingleMacro(kind=MacroCode.EX6)
-                x7_mac = SingleMacro(kind=MacroCode.EX7)
-                x8_mac = SingleMacro(kind=MacroCode.EX8)
-
-                pan_l_mac.data.clear()
-                pan_r_mac.data.clear()
-                phase_res_mac.data.clear()
-                x4_mac.data.clear()
-                x5_mac.data.clear()
-                x6_mac.data.clear()
-                x7_mac.data.clear()
-                x8_mac.data.clear()
-
-                pan_l_mac_len = read_int(ins_data)
-                pan_r_mac_len = read_int(ins_data)
-                phase_res_mac_len = read_int(ins_data)
-                x4_mac_len = read_int(ins_data)
-                x5_mac_len = read_int(ins_data)
-                x6_mac_len = read_int(ins_data)
-                x7_mac_len = read_int(ins_data)
-                x8_mac_len = read_int(ins_data)
-
-                pan_l_mac_loop = read_int(ins_data)
-                pan_r_mac_loop = read_int(ins_data)
-                phase_res_mac_loop = read_int(ins_data)
-                x4_mac_loop = read_int(ins_data)
-                x5_mac_loop = read_int(ins_data)
-                x6_mac_loop = read_int(ins_data)
-                x7_mac_loop = read_int(ins_data)
-                x8_mac_loop = read_int(ins_data)
-
-                pan_l_mac_rel = read_int(ins_data)
-                pan_r_mac_rel = read_int(ins_data)
-                phase_res_mac_rel = read_int(ins_data)
-                x4_mac_rel = read_int(ins_data)
-                x5_mac_rel = read_int(ins_data)
-                x6_mac_rel = read_int(ins_data)
-                x7_mac_rel = read_int(ins_data)
-                x8_mac_rel = read_int(ins_data)
-
-                pan_l_mac.open = bool(read_byte(ins_data))
-                pan_r_mac.open = bool(read_byte(ins_data))
-                phase_res_mac.open = bool(read_byte(ins_data))
-                x4_mac.open = bool(read_byte(ins_data))
-                x5_mac.open = bool(read_byte(ins_data))
-                x6_mac.open = bool(read_byte(ins_data))
-                x7_mac.open = bool(read_byte(ins_data))
-                x8_mac.open = bool(read_byte(ins_data))
-
-                add_to_macro_data(
-                    pan_l_mac.data,
-                    pan_l_mac_loop,
-                    pan_l_mac_rel,
-                    [read_int(ins_data) for _ in range(pan_l_mac_len)],
-                )
-                add_to_macro_data(
-                    pan_r_mac.data,
-                    pan_r_mac_loop,
-                    pan_r_mac_rel,
-                    [read_int(ins_data) for _ in range(pan_r_mac_len)],
-                )
-                add_to_macro_data(
-                    phase_res_mac.data,
-                    phase_res_mac_loop,
-                    phase_res_mac_rel,
-                    [read_int(ins_data) for _ in range(phase_res_mac_len)],
-                )
-                add_to_macro_data(
-                    x4_mac.data,
-                    x4_mac_loop,
-                    x4_mac_rel,
-                    [read_int(ins_data) for _ in range(x4_mac_len)],
-                )
-                add_to_macro_data(
-                    x5_mac.data,
-                    x5_mac_loop,
-                    x5_mac_rel,
-                    [read_int(ins_data) for _ in range(x5_mac_len)],
-                )
-                add_to_macro_data(
-                    x6_mac.data,
-                    x6_mac_loop,
-                    x6_mac_rel,
-                    [read_int(ins_data) for _ in range(x6_mac_len)],
-                )
-                add_to_macro_data(
-                    x7_mac.data,
-                    x7_mac_loop,
-                    x7_mac_rel,
-                    [read_int(ins_data) for _ in range(x7_mac_len)],
-                )
-                add_to_macro_data(
-                    x8_mac.data,
-                    x8_mac_loop,
-                    x8_mac_rel,
-                    [read_int(ins_data) for _ in range(x8_mac_len)],
-                )
-
-                mac_list.extend(
-                    [
-                        pan_l_mac,
-                        pan_r_mac,
-                        phase_res_mac,
-                        x4_mac,
-                        x5_mac,
-                        x6_mac,
-                        x7_mac,
-                        x8_mac,
-                    ]
-                )
+        if version >= 76:
+            (
+                pan_l_mac,
+                pan_r_mac,
+                phase_res_mac,
+                x4_mac,
+                x5_mac,
+                x6_mac,
+                x7_mac,
+                x8_mac,
+            ) = more_macs = read_macro_set(
+                (
+                    MacroCode.PAN_L,
+                    MacroCode.PAN_R,
+                    MacroCode.PHASE_RESET,
+                    MacroCode.EX4,
+                    MacroCode.EX5,
+                    MacroCode.EX6,
+                    MacroCode.EX7,
+                    MacroCode.EX8,
+                ),
+                ins_data.u32s,
+            )
+            mac_list.extend(more_macs)
 
         # fds
-        if True:
-            if self.meta.version >= 76:
-                fds = InsFeatureFDS(
-                    mod_speed=read_int(ins_data),
-                    mod_depth=read_int(ins_data),
-                    init_table_with_first_wave=bool(read_byte(ins_data)),
-                )
-                read_byte(ins_data)  # reserved
-                read_byte(ins_data)
-                read_byte(ins_data)
-                fds.mod_table = [read_byte(ins_data) for _ in range(32)]
-                self.features.append(fds)
+        if version >= 76:
+            fds = InsFeatureFDS(
+                mod_speed=u32(),
+                mod_depth=u32(),
+                init_table_with_first_wave=bool(u8()),
+            )
+            ins_data.skip(3)  # reserved
+            fds.mod_table = list(ins_data.unpack("<32B"))
+            add_feature(fds)
 
         # opz
-        if True:
-            if self.meta.version >= 77:
-                fm.fms2 = read_byte(ins_data)
-                fm.ams2 = read_byte(ins_data)
+        if version >= 77:
+            fm.fms2 = u8()
+            fm.ams2 = u8()
 
         # wave synth
-        if True:
-            if self.meta.version >= 79:
-                ws = InsFeatureWaveSynth(
-                    wave_indices=[read_int(ins_data), read_int(ins_data)],
-                    rate_divider=read_byte(ins_data),
-                    effect=WaveFX(read_byte(ins_data)),
-                    enabled=bool(read_byte(ins_data)),
-                    global_effect=bool(read_byte(ins_data)),
-                    speed=read_byte(ins_data),
-                    params=[read_byte(ins_data) for _ in range(4)],
-                )
-                self.features.append(ws)
+        if version >= 79:
+            ws = InsFeatureWaveSynth(
+                wave_indices=[u32(), u32()],
+                rate_divider=u8(),
+                effect=WaveFX(u8()),
+                enabled=bool(u8()),
+                global_effect=bool(u8()),
+                speed=u8(),
+                params=ins_data.u8s(4),
+            )
+            add_feature(ws)
 
         # macro moads
-        if True:
-            if self.meta.version >= 84:
-                vol_mac.mode = read_byte(ins_data)
-                duty_mac.mode = read_byte(ins_data)
-                wave_mac.mode = read_byte(ins_data)
-                pitch_mac.mode = read_byte(ins_data)
-                x1_mac.mode = read_byte(ins_data)
-                x2_mac.mode = read_byte(ins_data)
-                x3_mac.mode = read_byte(ins_data)
-                alg_mac.mode = read_byte(ins_data)
-                fb_mac.mode = read_byte(ins_data)
-                fms_mac.mode = read_byte(ins_data)
-                ams_mac.mode = read_byte(ins_data)
-                pan_l_mac.mode = read_byte(ins_data)
-                pan_r_mac.mode = read_byte(ins_data)
-                phase_res_mac.mode = read_byte(ins_data)
-                x4_mac.mode = read_byte(ins_data)
-                x5_mac.mode = read_byte(ins_data)
-                x6_mac.mode = read_byte(ins_data)
-                x7_mac.mode = read_byte(ins_data)
-                x8_mac.mode = read_byte(ins_data)
+        if version >= 84:
+            (
+                vol_mac.mode,
+                duty_mac.mode,
+                wave_mac.mode,
+                pitch_mac.mode,
+                x1_mac.mode,
+                x2_mac.mode,
+                x3_mac.mode,
+                alg_mac.mode,
+                fb_mac.mode,
+                fms_mac.mode,
+                ams_mac.mode,
+                pan_l_mac.mode,
+                pan_r_mac.mode,
+                phase_res_mac.mode,
+                x4_mac.mode,
+                x5_mac.mode,
+                x6_mac.mode,
+                x7_mac.mode,
+                x8_mac.mode,
+            ) = ins_data.unpack("<19B")
 
         # c64 no test
-        if True:
-            if self.meta.version >= 89:
-                c64.no_test = bool(read_byte(ins_data))
+        if version >= 89:
+            c64.no_test = bool(u8())
 
         # multipcm
-        if True:
-            if self.meta.version >= 93:
-                mp = InsFeatureMultiPCM(
-                    ar=read_byte(ins_data),
-                    d1r=read_byte(ins_data),
-                    dl=read_byte(ins_data),
-                    d2r=read_byte(ins_data),
-                    rr=read_byte(ins_data),
-                    rc=read_byte(ins_data),
-                    lfo=read_byte(ins_data),
-                    vib=read_byte(ins_data),
-                    am=read_byte(ins_data),
-                )
-                for _ in range(23):  # reserved
-                    read_byte(ins_data)
-                self.features.append(mp)
+        if version >= 93:
+            mp = InsFeatureMultiPCM(*ins_data.unpack(MULTIPCM_PARAMS))
+            add_feature(mp)
 
         # sound unit
-        if True:
-            if self.meta.version >= 104:
-                amiga.use_sample = bool(read_byte(ins_data))
-                su = InsFeatureSoundUnit(switch_roles=bool(read_byte(ins_data)))
-                self.features.append(su)
+        if version >= 104:
+            amiga.use_sample = bool(u8())
+            su = InsFeatureSoundUnit(switch_roles=bool(u8()))
+            add_feature(su)
 
         # gb hw seq
-        if True:
-            if self.meta.version >= 105:
-                gb_hwseq_len = read_byte(ins_data)
-                gb.hw_seq.clear()
-                for i in range(gb_hwseq_len):
-                    gb.hw_seq.append(
-                        GBHwSeq(
-                            command=GBHwCommand(read_byte(ins_data)),
-                            data=[read_byte(ins_data), read_byte(ins_data)],
-                        )
+        if version >= 105:
+            gb_hwseq_len = u8()
+            gb.hw_seq.clear()
+            for i in range(gb_hwseq_len):
+                gb.hw_seq.append(
+                    GBHwSeq(
+                        command=GBHwCommand(u8()),
+                        data=list(ins_data.unpack("<BB")),
                     )
+                )
 
         # additional gb
-        if True:
-            if self.meta.version >= 106:
-                gb.soft_env = bool(read_byte(ins_data))
-                gb.always_init = bool(read_byte(ins_data))
+        if version >= 106:
+            gb_soft_env, gb_always_init = ins_data.unpack("<2B")
+            gb.soft_env = gb_soft_env != 0
+            gb.always_init = gb_always_init != 0
 
         # es5506
-        if True:
-            if self.meta.version >= 107:
-                es = InsFeatureES5506(
-                    filter_mode=ESFilterMode(read_byte(ins_data)),
-                    k1=read_short(ins_data),
-                    k2=read_short(ins_data),
-                    env_count=read_short(ins_data),
-                    left_volume_ramp=read_byte(ins_data),
-                    right_volume_ramp=read_byte(ins_data),
-                    k1_ramp=read_byte(ins_data),
-                    k2_ramp=read_byte(ins_data),
-                    k1_slow=read_byte(ins_data),
-                    k2_slow=read_byte(ins_data),
-                )
-                self.features.append(es)
+        if version >= 107:
+            (
+                es_filter_mode,
+                es_k1,
+                es_k2,
+                es_env_count,
+                es_left_volume_ramp,
+                es_right_volume_ramp,
+                es_k1_ramp,
+                es_k2_ramp,
+                es_k1_slow,
+                es_k2_slow,
+            ) = ins_data.unpack(ES5506_PARAMS)
+            es = InsFeatureES5506(
+                filter_mode=ES_FILTER_MODES.get(es_filter_mode)
+                or ESFilterMode(es_filter_mode),
+                k1=es_k1,
+                k2=es_k2,
+                env_count=es_env_count,
+                left_volume_ramp=es_left_volume_ramp,
+                right_volume_ramp=es_right_volume_ramp,
+                k1_ramp=es_k1_ramp,
+                k2_ramp=es_k2_ramp,
+                k1_slow=es_k1_slow,
+                k2_slow=es_k2_slow,
+            )
+            add_feature(es)
 
         # snes
-        if True:
-            if self.meta.version >= 109:
-                snes = InsFeatureSNES()
-                snes.use_env = bool(read_byte(ins_data))
-                if self.meta.version >= 118:
-                    snes.gain_mode = GainMode(read_byte(ins_data))
-                    snes.gain = read_byte(ins_data)
-                else:
-                    read_byte(ins_data)
-                    read_byte(ins_data)
-                snes.envelope.a = read_byte(ins_data)
-                snes.envelope.d = read_byte(ins_data)
-                snes_env_s = read_byte(ins_data)
-                snes.envelope.s = snes_env_s & 0b111
-                snes.envelope.r = read_byte(ins_data)
-                snes.sus = SNESSusMode((snes_env_s >> 3) & 1)  # ???
-                self.features.append(snes)
+        if version >= 109:
+            snes = InsFeatureSNES()
+            (
+                snes_use_env,
+                snes_gain_mode,
+                snes_gain,
+                snes.envelope.a,
+                snes.envelope.d,
+                snes_env_s,
+                snes.envelope.r,
+            ) = ins_data.unpack(SNES_PARAMS)
+            snes.use_env = snes_use_env != 0
+            if version >= 118:  # unused before then
+                snes.gain_mode = GAIN_MODES.get(snes_gain_mode) or GainMode(
+                    snes_gain_mode
+                )
+                snes.gain = snes_gain
+            snes.envelope.s = snes_env_s & 0b111
+            snes.sus = SNES_SUS_MODES[(snes_env_s >> 3) & 1]  # ???
+            add_feature(snes)
 
         # macro speed delay
-        if True:
-            if self.meta.version >= 111:
-                vol_mac.speed = read_byte(ins_data)
-                arp_mac.speed = read_byte(ins_data)
-                duty_mac.speed = read_byte(ins_data)
-                wave_mac.speed = read_byte(ins_data)
-                pitch_mac.speed = read_byte(ins_data)
-                x1_mac.speed = read_byte(ins_data)
-                x2_mac.speed = read_byte(ins_data)
-                x3_mac.speed = read_byte(ins_data)
-                alg_mac.speed = read_byte(ins_data)
-                fb_mac.speed = read_byte(ins_data)
-                fms_mac.speed = read_byte(ins_data)
-                ams_mac.speed = read_byte(ins_data)
-                pan_l_mac.speed = read_byte(ins_data)
-                pan_r_mac.speed = read_byte(ins_data)
-                phase_res_mac.speed = read_byte(ins_data)
-                x4_mac.speed = read_byte(ins_data)
-                x5_mac.speed = read_byte(ins_data)
-                x6_mac.speed = read_byte(ins_data)
-                x7_mac.speed = read_byte(ins_data)
-                x8_mac.speed = read_byte(ins_data)
-
-                vol_mac.delay = read_byte(ins_data)
-                arp_mac.delay = read_byte(ins_data)
-                duty_mac.delay = read_byte(ins_data)
-                wave_mac.delay = read_byte(ins_data)
-                pitch_mac.delay = read_byte(ins_data)
-                x1_mac.delay = read_byte(ins_data)
-                x2_mac.delay = read_byte(ins_data)
-                x3_mac.delay = read_byte(ins_data)
-                alg_mac.delay = read_byte(ins_data)
-                fb_mac.delay = read_byte(ins_data)
-                fms_mac.delay = read_byte(ins_data)
-                ams_mac.delay = read_byte(ins_data)
-                pan_l_mac.delay = read_byte(ins_data)
-                pan_r_mac.delay = read_byte(ins_data)
-                phase_res_mac.delay = read_byte(ins_data)
-                x4_mac.delay = read_byte(ins_data)
-                x5_mac.delay = read_byte(ins_data)
-                x6_mac.delay = read_byte(ins_data)
-                x7_mac.delay = read_byte(ins_data)
-                x8_mac.delay = read_byte(ins_data)
-
-                for op in ops:
-                    for i in range(20):
-                        new_ops[op].macros[i].speed = read_byte(ins_data)
-                    for i in range(20):
-                        new_ops[op].macros[i].delay = read_byte(ins_data)
+        if version >= 111:
+            speed_delay = ins_data.unpack(MACRO_SPEED_DELAY)
+            macro_groups = [mac_list] + [new_op.macros for new_op in new_ops]
+            for group_start, macros in zip(range(0, 200, 40), macro_groups):
+                delay_start = group_start + 20
+                for group_mac, speed, delay in zip(
+                    macros,
+                    speed_delay[group_start:delay_start],
+                    speed_delay[delay_start : delay_start + 20],
+                ):
+                    group_mac.speed = speed
+                    group_mac.delay = delay
 
         # old arp mac format
-        if True:
-            if self.meta.version < 112:
-                if arp_mac.mode != 0:
-                    arp_mac.mode = 0
-                    for i in range(len(arp_mac.data)):
-                        if isinstance(arp_mac.data[i], int):
-                            arp_mac.data[i] = cast(int, arp_mac.data[i]) ^ 0x40000000
+        if version < 112:
+            if arp_mac.mode != 0:
+                arp_mac.mode = 0
+                arp_mac.data[:] = [
+                    x ^ 0x40000000 if isinstance(x, int) else x for x in arp_mac.data
+                ]
 
         # add ops macros at the end
-        if True:
-            if self.meta.version >= 29:
-                for _, op_contents in new_ops.items():
-                    self.features.append(op_contents)
+        if version >= 29:
+            self.features.extend(new_ops)
@@ -1,9 +1,30 @@
+import mmap
 import re
+import struct
+import sys
 import zlib
-from io import BytesIO, BufferedReader
-from typing import BinaryIO, Optional, Literal, Union, Dict, List, Callable
+from bisect import bisect_right
+from io import SEEK_CUR, BytesIO, BufferedReader
+from typing import (
+    BinaryIO,
+    Optional,
+    Literal,
+    Union,
+    Dict,
+    List,
+    Tuple,
+    Callable,
+    Any,
+    Iterator,
+    cast,
+)
 
-from chipchune._util import read_byte, read_short, read_int, read_float, read_str
+from chipchune._util import (
+    read_short,
+    read_int,
+    Cursor,
+    StreamCursor,
+)
 from .data_types import (
     ModuleMeta,
     ChipList,
@@ -36,6 +57,295 @@ from .sample import FurnaceSample
 MAGIC_STR = b"-Furnace module-"
 MAX_CHIPS = 32
 
+# how much of a compressed module to feed zlib at a time
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+
+# compat flag values for modules older than a given version, oldest cutoff first
+COMPAT_FLAG_DEFAULTS: Tuple[Tuple[int, Dict[str, Any]], ...] = (
+    (
+        37,
+        {
+            "limit_slides": True,
+            "linear_pitch": LinearPitch.ONLY_PITCH_CHANGE,
+            "loop_modality": LoopModality.HARD_RESET_CHANNELS,
+        },
+    ),
+    (43, {"proper_noise_layout": False, "wave_duty_is_volume": False}),
+    (
+        45,
+        {
+            "reset_macro_on_porta": True,
+            "legacy_volume_slides": True,
+            "compatible_arpeggio": True,
+            "note_off_resets_slides": True,
+            "target_resets_slides": True,
+        },
+    ),
+    (46, {"arpeggio_inhibits_portamento": True, "wack_algorithm_macro": True}),
+    (49, {"broken_shortcut_slides": True}),
+    (50, {"ignore_duplicates_slides": False}),
+    (62, {"stop_portamento_on_note_off": True}),
+    (64, {"broken_dac_mode": False}),
+    (65, {"one_tick_cut": False}),
+    (66, {"instrument_change_allowed_in_porta": False}),
+    (69, {"reset_note_base_on_arpeggio_stop": False}),
+    (
+        71,
+        {
+            "no_slides_on_first_tick": False,
+            "next_row_reset_arp_pos": False,
+            "ignore_jump_at_end": True,
+        },
+    ),
+    (72, {"buggy_portamento_after_slide": True, "gb_ins_affects_env": False}),
+    (78, {"shared_extch_state": False}),
+    (83, {"ignore_outside_dac_mode_change": True, "e1e2_takes_priority": False}),
+    (84, {"new_sega_pcm": False}),
+    (85, {"weird_fnum_pitch_slides": True}),
+    (86, {"sn_duty_resets_phase": True}),
+    (90, {"linear_pitch_macro": False}),
+    (
+        97,
+        {
+            "old_octave_boundary": True,
+            "disable_opn2_dac_volume_control": True,  # dev98
+        },
+    ),
+    (
+        99,
+        {
+            "new_volume_scaling": False,
+            "volume_macro_lingers": False,
+            "broken_out_vol": True,
+        },
+    ),
+    (100, {"e1e2_stop_on_same_note": False}),
+    (101, {"broken_porta_after_arp": True}),
+    (108, {"sn_no_low_periods": True}),
+    (110, {"cut_delay_effect_policy": DelayBehavior.BROKEN}),
+    (113, {"jump_treatment": JumpTreatment.FIRST_JUMP_ONLY}),
+    (115, {"auto_sys_name": True}),
+    (117, {"disable_sample_macro": True}),
+    (121, {"broken_out_vol_2": False}),
+    (130, {"old_arp_strategy": True}),
+    (138, {"broken_porta_during_legato": True}),
+    (155, {"broken_fm_off": True}),
+    (168, {"pre_note_no_effect": True}),
+    (183, {"old_dpcm": True}),
+    (184, {"reset_arp_phase_on_new_note": False}),
+    (188, {"ceil_volume_scaling": False}),
+    (191, {"old_always_set_volume": True}),
+    (200, {"old_sample_offset": True}),
+)
+COMPAT_FLAG_CUTOFFS = [version for version, _ in COMPAT_FLAG_DEFAULTS]
+
+# magic, version, reserved, song info pointer, reserved
+FILE_HEADER = struct.Struct("<16xH2xI8x")
+
+# fixed-size start of the INFO block: first subsong's timing and the number
+# of instruments, wavetables, samples and patterns
+INFO_HEADER = struct.Struct("<4BfHH2B3HI")
+
+# legacy chip volumes followed by legacy chip pannings
+CHIP_VOLUME_PANNING = struct.Struct("<%db" % (MAX_CHIPS * 2))
+
+# enum lookups for values decoded in bulk
+NOTES = {note.value: note for note in Note}
+INPUT_PORT_SETS = {port_set.value: port_set for port_set in InputPortSet}
+OUTPUT_PORT_SETS = {port_set.value: port_set for port_set in OutputPortSet}
+
+# largest encoding of a PATN row: flags, two effect presence bytes, note,
+# instrument, volume and 8 effect/value pairs. the rows end with 0xFF
+PATN_MAX_ROW_SIZE = 1 + 2 + 3 + 2 * 8
+
+# PATN raw note byte -> (note, octave). 0 is C-(-5), 180-182 are note offs
+NEW_PATTERN_NOTES: List[Tuple[Note, int]] = [
+    (NOTES[raw % 12 or 12], -5 + raw // 12) for raw in range(256)
+]
+NEW_PATTERN_NOTES[180] = (Note.OFF, 0)
+NEW_PATTERN_NOTES[181] = (Note.OFF_REL, 0)
+NEW_PATTERN_NOTES[182] = (Note.REL, 0)
+
+# float values in a chip's FLAG block
+FLOAT_FLAG_RE = re.compile(r"\d+\.\d+")
+
+OldChipFlags = Dict[str, Union[bool, int]]
+
+
+def _clock_sel(mask: int) -> Callable[[int], OldChipFlags]:
+    return lambda flag: {"clockSel": flag & mask}
+
+
+def _ladder_flags(flag: int) -> OldChipFlags:
+    return {
+        "clockSel": flag & 2147483647,  # bits 0-30
+        "ladderEffect": bool((flag >> 31) & 1),
+    }
+
+
+def _sms_flags(flag: int) -> OldChipFlags:
+    cs = flag & 0xFF03
+    if cs > 0x100:
+        cs = cs - 252  # 0x100 + 4
+    ct = (flag & 0xCC) // 4
+    if ct >= 32:
+        ct -= 24
+    elif ct >= 16:
+        ct -= 12
+    return {"clockSel": cs, "chipType": ct, "noPhaseReset": flag >> 4}
+
+
+def _tsu_flags(flag: int) -> OldChipFlags:
+    return {
+        "clockSel": flag & 1,
+        "echo": bool((flag >> 2) & 1),
+        "swapEcho": bool((flag >> 3) & 1),
+        "sampleMemSize": (flag >> 4) & 1,
+        "pdm": bool((flag >> 5) & 1),
+        "echoDelay": (flag >> 8) & 0b111111,
+        "echoFeedback": (flag >> 16) & 0b1111,
+        "echoResolution": (flag >> 20) & 0b1111,
+        "echoVol": (flag >> 24) & 0b11111111,
+    }
+
+
+# pre-v119 binary chip flags -> their dict-style equivalents
+OLD_CHIP_FLAG_DECODERS: Dict[ChipType, Callable[[int], OldChipFlags]] = {
+    ChipType.GENESIS: _ladder_flags,
+    ChipType.GENESIS_EX: _ladder_flags,
+    ChipType.SMS: _sms_flags,
+    ChipType.GB: lambda flag: {
+        "chipType": flag & 0b11,
+        "noAntiClick": bool((flag >> 3) & 1),
+    },
+    ChipType.PCE: lambda flag: {
+        "clockSel": flag & 1,
+        "chipType": (flag >> 2) & 1,
+        "noAntiClick": bool((flag >> 3) & 1),
+    },
+    ChipType.NES: _clock_sel(0b11),
+    ChipType.VRC6: _clock_sel(0b11),
+    ChipType.FDS: _clock_sel(0b11),
+    ChipType.MMC5: _clock_sel(0b11),
+    ChipType.C64_8580: _clock_sel(0b1111),
+    ChipType.C64_6581: _clock_sel(0b1111),
+    ChipType.SEGA_ARCADE: _clock_sel(0b11111111),
+    ChipType.NEO_GEO_CD: _clock_sel(0b11111111),
+    ChipType.NEO_GEO: _clock_sel(0b11111111),
+    ChipType.NEO_GEO_EX: _clock_sel(0b11111111),
+    ChipType.NEO_GEO_CD_EX: _clock_sel(0b11111111),
+    ChipType.YM2610B: _clock_sel(0b11111111),
+    ChipType.YM2610B_EX: _clock_sel(0b11111111),
+    ChipType.AY38910: lambda flag: {
+        "clockSel": flag & 0b1111,
+        "chipType": (flag >> 4) & 0b11,
+        "stereo": bool((flag >> 6) & 1),
+        "halfClock": bool((flag >> 7) & 1),
+        "stereoSep": (flag >> 8) & 0b11111111,
+    },
+    ChipType.AMIGA: lambda flag: {
+        "clockSel": flag & 1,
+        "chipType": (flag >> 1) & 1,
+        "bypassLimits": bool((flag >> 2) & 1),
+        "stereoSep": (flag >> 8) & 0b1111111,
+    },
+    ChipType.YM2151: _clock_sel(0b11111111),
+    ChipType.YM2612: _ladder_flags,
+    ChipType.YM2612_EX: _ladder_flags,
+    ChipType.YM2612_PLUS: _ladder_flags,
+    ChipType.YM2612_PLUS_EX: _ladder_flags,
+    ChipType.TIA: lambda flag: {
+        "clockSel": flag & 1,
+        "mixingType": (flag >> 1) & 0b11,
+    },
+    ChipType.VIC20: _clock_sel(1),
+    ChipType.SNES: lambda flag: {
+        "volScaleL": flag & 0b1111111,
+        "volScaleR": (flag >> 8) & 0b1111111,
+    },
+    ChipType.OPLL: lambda flag: {
+        "clockSel": flag & 0b1111,
+        "patchSet": flag >> 4,  # safe
+    },
+    ChipType.N163: lambda flag: {
+        "clockSel": flag & 0b1111,
+        "channels": (flag >> 4) & 0b111,
+        "multiplex": bool((flag >> 7) & 1),
+    },
+    ChipType.OPN: lambda flag: {
+        "clockSel": flag & 0b11111,
+        "prescale": (flag >> 5) & 0b11,
+    },
+    ChipType.OPL: _clock_sel(0b11111111),
+    ChipType.OPL_DRUMS: _clock_sel(0b11111111),
+    ChipType.OPL2: _clock_sel(0b11111111),
+    ChipType.OPL2_DRUMS: _clock_sel(0b11111111),
+    ChipType.Y8950: _clock_sel(0b11111111),
+    ChipType.Y8950_DRUMS: _clock_sel(0b11111111),
+    ChipType.OPL3: _clock_sel(0b11111111),
+    ChipType.OPL3_DRUMS: _clock_sel(0b11111111),
+    ChipType.PC_SPEAKER: lambda flag: {"speakerType": flag & 0b11},
+    ChipType.RF5C68: lambda flag: {
+        "clockSel": flag & 0b1111,
+        "chipType": flag >> 4,  # safe
+    },
+    ChipType.SAA1099: _clock_sel(0b11),
+    ChipType.OPZ: _clock_sel(0b11),
+    ChipType.AY8930: lambda flag: {
+        "clockSel": flag & 0b1111,
+        "stereo": bool((flag >> 6) & 1),
+        "halfClock": bool((flag >> 7) & 1),
+        "stereoSep": (flag >> 8) & 0b11111111,
+    },
+    ChipType.VRC7: _clock_sel(0b11),
+    ChipType.ZX_BEEPER: _clock_sel(1),
+    ChipType.SCC: _clock_sel(0b11),
+    ChipType.SCC_PLUS: _clock_sel(0b11),
+    ChipType.MSM6295: lambda flag: {
+        "clockSel": flag & 0b1111111,
+        "rateSel": bool((flag >> 7) & 1),
+    },
+    ChipType.MSM6258: _clock_sel(0b11),
+    ChipType.OPL4: _clock_sel(0b11111111),
+    ChipType.OPL4_DRUMS: _clock_sel(0b11111111),
+    ChipType.SETA: lambda flag: {
+        "clockSel": flag & 0b1111,
+        "stereo": bool((flag >> 4) & 1),
+    },
+    ChipType.ES5506: lambda flag: {"channels": flag & 0b11111},
+    ChipType.TSU: _tsu_flags,
+    ChipType.YMZ280B: _clock_sel(0b11111111),
+    ChipType.PCM_DAC: lambda flag: {
+        "rate": (flag & 0b1111111111111111) + 1,
+        "outDepth": (flag >> 16) & 0b1111,
+        "stereo": bool((flag >> 20) & 1),
+    },
+    ChipType.QSOUND: lambda flag: {
+        "echoDelay": flag & 0b1111111111111,
+        "echoFeedback": (flag >> 16) & 0b11111111,
+    },
+}
+OLD_CHIP_FLAG_DECODERS[ChipType.OPLL_DRUMS] = OLD_CHIP_FLAG_DECODERS[ChipType.OPLL]
+OLD_CHIP_FLAG_DECODERS[ChipType.YM2203_EX] = OLD_CHIP_FLAG_DECODERS[ChipType.OPN]
+
+
+def _decompress_chunks(stream: BinaryIO, head: bytes = b"") -> Iterator[bytes]:
+    """
+    Decompresses a zlib stream piece by piece, so that the compressed data
+    never has to be held in memory all at once. The decompressed data is only
+    held in full if the caller collects it.
+
+    :param stream: Compressed input.
+    :param head: Data already read from the start of the stream, if any.
+    """
+    decompressor = zlib.decompressobj()
+    yield decompressor.decompress(head)
+    for chunk in iter(lambda: stream.read(DECOMPRESS_CHUNK_SIZE), b""):
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
+    if not decompressor.eof:
+        raise zlib.error("Incomplete or truncated compressed module")
+
 
 class FurnaceModule:
     """
@@ -46,6 +356,27 @@ class FurnaceModule:
     "new" instrument-feature-list format.
     """
 
+    __slots__ = (
+        "file_name",
+        "meta",
+        "chips",
+        "compat_flags",
+        "subsongs",
+        "patchbay",
+        "instruments",
+        "patterns",
+        "wavetables",
+        "samples",
+        "__pattern_index",
+        "__song_info_ptr",
+        "__chip_flag_ptr",
+        "__instrument_ptr",
+        "__wavetable_ptr",
+        "__sample_ptr",
+        "__pattern_ptr",
+        "__subsong_ptr",
+    )
+
     def __init__(
         self, file_name_or_stream: Optional[Union[BufferedReader, str]] = None
     ) -> None:
@@ -91,12 +422,15 @@ class FurnaceModule:
         """
         self.patterns: List[FurnacePattern] = []
         """
-        List of all patterns in the module.
+        List of all patterns in the module. Call :meth:`index_patterns` after
+        modifying it, so that :meth:`get_pattern` sees the changes.
         """
         self.wavetables: List[FurnaceWavetable] = []
 
         self.samples: List[FurnaceWavetable] = []
 
+        self.__pattern_index: Dict[Tuple[int, int, int], FurnacePattern] = {}
+
         if isinstance(file_name_or_stream, BufferedReader):
             self.load_from_stream(file_name_or_stream)
         elif isinstance(file_name_or_stream, str):
@@ -115,13 +449,19 @@ class FurnaceModule:
                 "No file name set, either set self.file_name or pass file_name to the function"
             )
         with open(self.file_name, "rb") as f:
-            detect_magic = f.peek(len(MAGIC_STR))[: len(MAGIC_STR)]
+            detect_magic = f.read(len(MAGIC_STR))
             if (
                 detect_magic != MAGIC_STR
             ):  # this is probably compressed, so try decompressing it first
-                return self.load_from_bytes(zlib.decompress(f.read()))
+                data = BytesIO()
+                for chunk in _decompress_chunks(f, detect_magic):
+                    data.write(chunk)
+                data.seek(0)
+                return self.load_from_stream(data)
             else:  # uncompressed for sure
-                return self.load_from_stream(f)
+                # map the file in, rather than seeking around it with small reads
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self.load_from_stream(cast(BinaryIO, mapped))
 
     @staticmethod
     def decompress_to_file(in_name: str, out_name: str) -> int:
@@ -135,7 +475,7 @@ class FurnaceModule:
         """
         with open(in_name, "rb") as fi:
             with open(out_name, "wb") as fo:
-                return fo.write(zlib.decompress(fi.read()))
+                return sum(fo.write(chunk) for chunk in _decompress_chunks(fi))
 
     def load_from_bytes(self, data: bytes) -> None:
         """
@@ -152,7 +492,8 @@ class FurnaceModule:
         :param stream: File-like object containing the uncompressed module.
         """
         # assumes uncompressed stream
-        if stream.read(len(MAGIC_STR)) != MAGIC_STR:
+        header = stream.read(FILE_HEADER.size)
+        if not header.startswith(MAGIC_STR):
             raise RuntimeError(
                 "Bad magic value; this is not a Furnace file or is corrupt"
             )
@@ -163,7 +504,7 @@ class FurnaceModule:
         self.subsongs[0].order.clear()
         self.subsongs[0].speed_pattern.clear()
 
-        self.__read_header(stream)
+        self.__read_header(header)
         self.__init_compat_flags()
         self.__read_info(stream)
         if self.meta.version >= 119:
@@ -174,6 +515,7 @@ class FurnaceModule:
         if self.meta.version >= 95:
             self.__read_subsongs(stream)
         self.__read_patterns(stream)
+        self.index_patterns()
 
     def get_num_channels(self) -> int:
         """
@@ -181,10 +523,7 @@ class FurnaceModule:
 
         :return: Channel sum across all chips.
         """
-        num_channels = 0
-        for chip in self.chips.list:
-            num_channels += chip.type.channels
-        return num_channels
+        return sum(chip.type.channels for chip in self.chips.list)
 
     def get_pattern(
         self, channel: int, index: int, subsong: int = 0
@@ -197,352 +536,222 @@ class FurnaceModule:
         :param index: The index of the pattern within the subsong.
         :param subsong: The subsong number.
         :return: FurnacePattern object or None if no such pattern exists.
+
+        Lookups go through an index of :attr:`patterns` that is built when the
+        module is loaded. If :attr:`patterns` or any pattern's position is
+        changed afterwards, call :meth:`index_patterns` first.
         """
-        try:
-            return next(
-                filter(
-                    lambda x: x.channel == channel
-                    and x.index == index
-                    and x.subsong == subsong,
-                    self.patterns,
-                )
+        return self.__pattern_index.get((subsong, channel, index))
+
+    def index_patterns(self) -> None:
+        """
+        Rebuilds the index used by :meth:`get_pattern` from :attr:`patterns`.
+        """
+        self.__pattern_index = {}
+        for pattern in self.patterns:
+            # the first pattern for a given position wins
+            self.__pattern_index.setdefault(
+                (pattern.subsong, pattern.channel, pattern.index), pattern
             )
-        except StopIteration:
-            return None
 
     def __init_compat_flags(self) -> None:
         """
         Initializes appropriate compat flags based on module version
         """
-        if self.meta.version < 37:
-            self.compat_flags.limit_slides = True
-            self.compat_flags.linear_pitch = LinearPitch.ONLY_PITCH_CHANGE
-            self.compat_flags.loop_modality = LoopModality.HARD_RESET_CHANNELS
-        if self.meta.version < 43:
-            self.compat_flags.proper_noise_layout = False
-            self.compat_flags.wave_duty_is_volume = False
-        if self.meta.version < 45:
-            self.compat_flags.reset_macro_on_porta = True
-            self.compat_flags.legacy_volume_slides = True
-            self.compat_flags.compatible_arpeggio = True
-            self.compat_flags.note_off_resets_slides = True
-            self.compat_flags.target_resets_slides = True
-        if self.meta.version < 46:
-            self.compat_flags.arpeggio_inhibits_portamento = True
-            self.compat_flags.wack_algorithm_macro = True
-        if self.meta.version < 49:
-            self.compat_flags.broken_shortcut_slides = True
-        if self.meta.version < 50:
-            self.compat_flags.ignore_duplicates_slides = False
-        if self.meta.version < 62:
-            self.compat_flags.stop_portamento_on_note_off = True
-        if self.meta.version < 64:
-            self.compat_flags.broken_dac_mode = False
-        if self.meta.version < 65:
-            self.compat_flags.one_tick_cut = False
-        if self.meta.version < 66:
-            self.compat_flags.instrument_change_allowed_in_porta = False
-        if self.meta.version < 69:
-            self.compat_flags.reset_note_base_on_arpeggio_stop = False
-        if self.meta.version < 71:
-            self.compat_flags.no_slides_on_first_tick = False
-            self.compat_flags.next_row_reset_arp_pos = False
-            self.compat_flags.ignore_jump_at_end = True
-        if self.meta.version < 72:
-            self.compat_flags.buggy_portamento_after_slide = True
-            self.compat_flags.gb_ins_affects_env = False
-        if self.meta.version < 78:
-            self.compat_flags.shared_extch_state = False
-        if self.meta.version < 83:
-            self.compat_flags.ignore_outside_dac_mode_change = True
-            self.compat_flags.e1e2_takes_priority = False
-        if self.meta.version < 84:
-            self.compat_flags.new_sega_pcm = False
-        if self.meta.version < 85:
-            self.compat_flags.weird_fnum_pitch_slides = True
-        if self.meta.version < 86:
-            self.compat_flags.sn_duty_resets_phase = True
-        if self.meta.version < 90:
-            self.compat_flags.linear_pitch_macro = False
-        if self.meta.version < 97:
-            self.compat_flags.old_octave_boundary = True
-            self.compat_flags.disable_opn2_dac_volume_control = True  # dev98
-        if self.meta.version < 99:
-            self.compat_flags.new_volume_scaling = False
-            self.compat_flags.volume_macro_lingers = False
-            self.compat_flags.broken_out_vol = True
-        if self.meta.version < 100:
-            self.compat_flags.e1e2_stop_on_same_note = False
-        if self.meta.version < 101:
-            self.compat_flags.broken_porta_after_arp = True
-        if self.meta.version < 108:
-            self.compat_flags.sn_no_low_periods = True
-        if self.meta.version < 110:
-            self.compat_flags.cut_delay_effect_policy = DelayBehavior.BROKEN
-        if self.meta.version < 113:
-            self.compat_flags.jump_treatment = JumpTreatment.FIRST_JUMP_ONLY
-        if self.meta.version < 115:
-            self.compat_flags.auto_sys_name = True
-        if self.meta.version < 117:
-            self.compat_flags.disable_sample_macro = True
-        if self.meta.version < 121:
-            self.compat_flags.broken_out_vol_2 = False
-        if self.meta.version < 130:
-            self.compat_flags.old_arp_strategy = True
-        if self.meta.version < 138:
-            self.compat_flags.broken_porta_during_legato = True
-        if self.meta.version < 155:
-            self.compat_flags.broken_fm_off = True
-        if self.meta.version < 168:
-            self.compat_flags.pre_note_no_effect = True
-        if self.meta.version < 183:
-            self.compat_flags.old_dpcm = True
-        if self.meta.version < 184:
-            self.compat_flags.reset_arp_phase_on_new_note = False
-        if self.meta.version < 188:
-            self.compat_flags.ceil_volume_scaling = False
-        if self.meta.version < 191:
-            self.compat_flags.old_always_set_volume = True
-        if self.meta.version < 200:
-            self.compat_flags.old_sample_offset = True
+        # cutoffs are sorted, so every entry from the first cutoff above this
+        # version onwards applies
+        first = bisect_right(COMPAT_FLAG_CUTOFFS, self.meta.version)
+        for _, flags in COMPAT_FLAG_DEFAULTS[first:]:
+            for name, value in flags.items():
+                setattr(self.compat_flags, name, value)
 
     # XXX: update my signature whenever a new compat flag block is added
-    def __read_compat_flags(self, stream: BinaryIO, phase: Literal[1, 2, 3]) -> None:
+    def __read_compat_flags(
+        self, stream: Union[Cursor, StreamCursor], phase: Literal[1, 2, 3]
+    ) -> None:
         """
         Reads the set compat flags in the module
         """
         if phase == 1:
-            compat_flags_to_skip = 20
             if self.meta.version < 37:
-                self.compat_flags.limit_slides = True
-                self.compat_flags.linear_pitch = LinearPitch.ONLY_PITCH_CHANGE
-                self.compat_flags.loop_modality = LoopModality.HARD_RESET_CHANNELS
-            else:  # >= 37
-                self.compat_flags.limit_slides = bool(read_byte(stream))
-                self.compat_flags.linear_pitch = LinearPitch(read_byte(stream))
-                self.compat_flags.loop_modality = LoopModality(read_byte(stream))
-                compat_flags_to_skip -= 3
-
-                if self.meta.version >= 43:
-                    self.compat_flags.proper_noise_layout = bool(read_byte(stream))
-                    self.compat_flags.wave_duty_is_volume = bool(read_byte(stream))
-                    compat_flags_to_skip -= 2
-
-                if self.meta.version >= 45:
-                    self.compat_flags.reset_macro_on_porta = bool(read_byte(stream))
-                    self.compat_flags.legacy_volume_slides = bool(read_byte(stream))
-                    self.compat_flags.compatible_arpeggio = bool(read_byte(stream))
-                    self.compat_flags.note_off_resets_slides = bool(read_byte(stream))
-                    self.compat_flags.target_resets_slides = bool(read_byte(stream))
-                    compat_flags_to_skip -= 5
-
-                if self.meta.version >= 47:
-                    self.compat_flags.arpeggio_inhibits_portamento = bool(
-                        read_byte(stream)
-                    )
-                    self.compat_flags.wack_algorithm_macro = bool(read_byte(stream))
-                    compat_flags_to_skip -= 2
-
-                if self.meta.version >= 49:
-                    self.compat_flags.broken_shortcut_slides = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
-
-                if self.meta.version >= 50:
-                    self.compat_flags.ignore_duplicates_slides = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
-
-                if self.meta.version >= 62:
-                    self.compat_flags.stop_portamento_on_note_off = bool(
-                        read_byte(stream)
-                    )
-                    self.compat_flags.continuous_vibrato = bool(read_byte(stream))
-                    compat_flags_to_skip -= 2
+                # nothing to read yet, __init_compat_flags has set these up
+                stream.skip(20)
+                return
+            flags = stream.read(20)  # fixed size, unused flags are reserved
+            self.compat_flags.limit_slides = bool(flags[0])
+            self.compat_flags.linear_pitch = LinearPitch(flags[1])
+            self.compat_flags.loop_modality = LoopModality(flags[2])
+
+            if self.meta.version >= 43:
+                self.compat_flags.proper_noise_layout = bool(flags[3])
+                self.compat_flags.wave_duty_is_volume = bool(flags[4])
+
+            if self.meta.version >= 45:
+                self.compat_flags.reset_macro_on_porta = bool(flags[5])
+                self.compat_flags.legacy_volume_slides = bool(flags[6])
+                self.compat_flags.compatible_arpeggio = bool(flags[7])
+                self.compat_flags.note_off_resets_slides = bool(flags[8])
+                self.compat_flags.target_resets_slides = bool(flags[9])
+
+            if self.meta.version >= 47:
+                self.compat_flags.arpeggio_inhibits_portamento = bool(flags[10])
+                self.compat_flags.wack_algorithm_macro = bool(flags[11])
+
+            if self.meta.version >= 49:
+                self.compat_flags.broken_shortcut_slides = bool(flags[12])
+
+            if self.meta.version >= 50:
+                self.compat_flags.ignore_duplicates_slides = bool(flags[13])
+
+            if self.meta.version >= 62:
+                self.compat_flags.stop_portamento_on_note_off = bool(flags[14])
+                self.compat_flags.continuous_vibrato = bool(flags[15])
+
+            if self.meta.version >= 64:
+                self.compat_flags.broken_dac_mode = bool(flags[16])
+
+            if self.meta.version >= 65:
+                self.compat_flags.one_tick_cut = bool(flags[17])
+
+            if self.meta.version >= 66:
+                self.compat_flags.instrument_change_allowed_in_porta = bool(flags[18])
+
+            if self.meta.version >= 69:
+                self.compat_flags.reset_note_base_on_arpeggio_stop = bool(flags[19])
+        elif phase == 2:
+            if self.meta.version < 70:
+                stream.skip(28)
+                return
+            flags = stream.read(28)  # fixed size, unused flags are reserved
+            self.compat_flags.broken_speed_selection = bool(flags[0])
 
-                if self.meta.version >= 64:
-                    self.compat_flags.broken_dac_mode = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 71:
+                self.compat_flags.no_slides_on_first_tick = bool(flags[1])
+                self.compat_flags.next_row_reset_arp_pos = bool(flags[2])
+                self.compat_flags.ignore_jump_at_end = bool(flags[3])
 
-                if self.meta.version >= 65:
-                    self.compat_flags.one_tick_cut = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 72:
+                self.compat_flags.buggy_portamento_after_slide = bool(flags[4])
+                self.compat_flags.gb_ins_affects_env = bool(flags[5])
 
-                if self.meta.version >= 66:
-                    self.compat_flags.instrument_change_allowed_in_porta = bool(
-                        read_byte(stream)
-                    )
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 78:
+                self.compat_flags.shared_extch_state = bool(flags[6])
 
-                if self.meta.version >= 69:
-                    self.compat_flags.reset_note_base_on_arpeggio_stop = bool(
-                        read_byte(stream)
-                    )
-                    compat_flags_to_skip -= 1
-        elif phase == 2:
-            compat_flags_to_skip = 28
-            if self.meta.version >= 70:
-                self.compat_flags.broken_speed_selection = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
-
-                if self.meta.version >= 71:
-                    self.compat_flags.no_slides_on_first_tick = bool(read_byte(stream))
-                    self.compat_flags.next_row_reset_arp_pos = bool(read_byte(stream))
-                    self.compat_flags.ignore_jump_at_end = bool(read_byte(stream))
-                    compat_flags_to_skip -= 3
-
-                if self.meta.version >= 72:
-                    self.compat_flags.buggy_portamento_after_slide = bool(
-                        read_byte(stream)
-                    )
-                    self.compat_flags.gb_ins_affects_env = bool(read_byte(stream))
-                    compat_flags_to_skip -= 2
+            if self.meta.version >= 83:
+                self.compat_flags.ignore_outside_dac_mode_change = bool(flags[7])
+                self.compat_flags.e1e2_takes_priority = bool(flags[8])
 
-                if self.meta.version >= 78:
-                    self.compat_flags.shared_extch_state = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 84:
+                self.compat_flags.new_sega_pcm = bool(flags[9])
 
-                if self.meta.version >= 83:
-                    self.compat_flags.ignore_outside_dac_mode_change = bool(
-                        read_byte(stream)
-                    )
-                    self.compat_flags.e1e2_takes_priority = bool(read_byte(stream))
-                    compat_flags_to_skip -= 2
+            if self.meta.version >= 85:
+                self.compat_flags.weird_fnum_pitch_slides = bool(flags[10])
 
-                if self.meta.version >= 84:
-                    self.compat_flags.new_sega_pcm = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 86:
+                self.compat_flags.sn_duty_resets_phase = bool(flags[11])
 
-                if self.meta.version >= 85:
-                    self.compat_flags.weird_fnum_pitch_slides = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 90:
+                self.compat_flags.linear_pitch_macro = bool(flags[12])
 
-                if self.meta.version >= 86:
-                    self.compat_flags.sn_duty_resets_phase = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 94:
+                self.compat_flags.pitch_slide_speed_in_linear = flags[13]
 
-                if self.meta.version >= 90:
-                    self.compat_flags.linear_pitch_macro = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 97:
+                self.compat_flags.old_octave_boundary = bool(flags[14])
 
-                if self.meta.version >= 94:
-                    self.compat_flags.pitch_slide_speed_in_linear = read_byte(stream)
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 98:
+                self.compat_flags.disable_opn2_dac_volume_control = bool(flags[15])
 
-                if self.meta.version >= 97:
-                    self.compat_flags.old_octave_boundary = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 99:
+                self.compat_flags.new_volume_scaling = bool(flags[16])
+                self.compat_flags.volume_macro_lingers = bool(flags[17])
+                self.compat_flags.broken_out_vol = bool(flags[18])
 
-                if self.meta.version >= 98:
-                    self.compat_flags.disable_opn2_dac_volume_control = bool(
-                        read_byte(stream)
-                    )
-                    compat_flags_to_skip -= 1
-
-                if self.meta.version >= 99:
-                    self.compat_flags.new_volume_scaling = bool(read_byte(stream))
-                    self.compat_flags.volume_macro_lingers = bool(read_byte(stream))
-                    self.compat_flags.broken_out_vol = bool(read_byte(stream))
-                    compat_flags_to_skip -= 3
+            if self.meta.version >= 100:
+                self.compat_flags.e1e2_stop_on_same_note = bool(flags[19])
 
-                if self.meta.version >= 100:
-                    self.compat_flags.e1e2_stop_on_same_note = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 101:
+                self.compat_flags.broken_porta_after_arp = bool(flags[20])
 
-                if self.meta.version >= 101:
-                    self.compat_flags.broken_porta_after_arp = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 108:
+                self.compat_flags.sn_no_low_periods = bool(flags[21])
 
-                if self.meta.version >= 108:
-                    self.compat_flags.sn_no_low_periods = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 110:
+                self.compat_flags.cut_delay_effect_policy = DelayBehavior(flags[22])
 
-                if self.meta.version >= 110:
-                    self.compat_flags.cut_delay_effect_policy = DelayBehavior(
-                        read_byte(stream)
-                    )
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 113:
+                self.compat_flags.jump_treatment = JumpTreatment(flags[23])
 
-                if self.meta.version >= 113:
-                    self.compat_flags.jump_treatment = JumpTreatment(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 115:
+                self.compat_flags.auto_sys_name = bool(flags[24])
 
-                if self.meta.version >= 115:
-                    self.compat_flags.auto_sys_name = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 117:
+                self.compat_flags.disable_sample_macro = bool(flags[25])
 
-                if self.meta.version >= 117:
-                    self.compat_flags.disable_sample_macro = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 121:
+                self.compat_flags.broken_out_vol_2 = bool(flags[26])
 
-                if self.meta.version >= 121:
-                    self.compat_flags.broken_out_vol_2 = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
-
-                if self.meta.version >= 130:
-                    self.compat_flags.old_arp_strategy = bool(read_byte(stream))
-                    compat_flags_to_skip -= 1
+            if self.meta.version >= 130:
+                self.compat_flags.old_arp_strategy = bool(flags[27])
 
         elif phase == 3:
-            compat_flags_to_skip = 8
-            if self.meta.version >= 138:
-                self.compat_flags.broken_porta_during_legato = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+            if self.meta.version < 138:
+                stream.skip(8)
+                return
+            flags = stream.read(8)  # fixed size, unused flags are reserved
+            self.compat_flags.broken_porta_during_legato = bool(flags[0])
 
             if self.meta.version >= 155:
-                self.compat_flags.broken_fm_off = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+                self.compat_flags.broken_fm_off = bool(flags[1])
 
             if self.meta.version >= 168:
-                self.compat_flags.pre_note_no_effect = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+                self.compat_flags.pre_note_no_effect = bool(flags[2])
 
             if self.meta.version >= 183:
-                self.compat_flags.old_dpcm = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+                self.compat_flags.old_dpcm = bool(flags[3])
 
             if self.meta.version >= 184:
-                self.compat_flags.reset_arp_phase_on_new_note = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+                self.compat_flags.reset_arp_phase_on_new_note = bool(flags[4])
 
             if self.meta.version >= 188:
-                self.compat_flags.ceil_volume_scaling = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+                self.compat_flags.ceil_volume_scaling = bool(flags[5])
 
             if self.meta.version >= 191:
-                self.compat_flags.old_always_set_volume = bool(read_byte(stream))
-                compat_flags_to_skip -= 1
+                self.compat_flags.old_always_set_volume = bool(flags[6])
         else:
             raise ValueError("Compat flag phase must be in between: 1, 2, 3")
-        stream.read(compat_flags_to_skip)
 
     def __read_dev119_chip_flags(self, stream: BinaryIO) -> None:
-        for i in range(len(self.chips.list)):
+        for chip, flag_ptr in zip(self.chips.list, self.__chip_flag_ptr):
             # skip if this chip doesn't have flags
-            if self.__chip_flag_ptr[i] == 0:
+            if flag_ptr == 0:
                 continue
-            stream.seek(self.__chip_flag_ptr[i])
+            stream.seek(flag_ptr)
 
             if stream.read(4) != b"FLAG":
                 raise ValueError('No "FLAG" magic')
 
             # i assume this will grow, you never know
             blk_size = read_int(stream)
-            flag_blk = BytesIO(stream.read(blk_size))
+            flag_blk = Cursor(stream.read(blk_size))
 
             # read entries in FLAG
-            for entry in [flag.split("=") for flag in read_str(flag_blk).split()]:
-                key = entry[0]
+            flags = chip.flags
+            for entry in [flag.split("=") for flag in flag_blk.cstr().split()]:
+                # share key strings with the literals used elsewhere
+                key = sys.intern(entry[0])
                 value = entry[1]
-                # cast by regex
-                if re.match(r"true", value):
-                    self.chips.list[i].flags[key] = True
-                elif re.match(r"false", value):
-                    self.chips.list[i].flags[key] = False
-                elif re.match(r"\d+$", value):
-                    self.chips.list[i].flags[key] = int(value)
-                elif re.match(r"\d+\.\d+", value):
-                    self.chips.list[i].flags[key] = float(value)
+                # cast by format, integers being the most common
+                if value.isdecimal():
+                    flags[key] = int(value)
+                elif value.startswith("true"):
+                    flags[key] = True
+                elif value.startswith("false"):
+                    flags[key] = False
+                elif FLOAT_FLAG_RE.match(value):
+                    flags[key] = float(value)
                 else:  # all other values should be treated as a string
-                    self.chips.list[i].flags[key] = value
+                    flags[key] = value
 
     @staticmethod
     def __convert_old_chip_flags(
@@ -555,152 +764,14 @@ class FurnaceModule:
         :param flag: flag value as a 32-bit number
         :return: dictionary containing the flag's equivalent values
         """
-        n = {}
-
-        if chip in [ChipType.GENESIS, ChipType.GENESIS_EX]:
-            n["clockSel"] = flag & 2147483647  # bits 0-30
-            n["ladderEffect"] = bool((flag >> 31) & 1)
-        elif chip == ChipType.SMS:
-            cs = flag & 0xFF03
-            if cs > 0x100:
-                cs = cs - 252  # 0x100 + 4
-            n["clockSel"] = cs
-            ct = (flag & 0xCC) // 4
-            if ct >= 32:
-                ct -= 24
-            elif ct >= 16:
-                ct -= 12
-            n["chipType"] = ct
-            n["noPhaseReset"] = flag >> 4
-        elif chip == ChipType.GB:
-            n["chipType"] = flag & 0b11
-            n["noAntiClick"] = bool((flag >> 3) & 1)
-        elif chip == ChipType.PCE:
-            n["clockSel"] = flag & 1
-            n["chipType"] = (flag >> 2) & 1
-            n["noAntiClick"] = bool((flag >> 3) & 1)
-        elif chip in [ChipType.NES, ChipType.VRC6, ChipType.FDS, ChipType.MMC5]:
-            n["clockSel"] = flag & 0b11
-        elif chip in [ChipType.C64_8580, ChipType.C64_6581]:
-            n["clockSel"] = flag & 0b1111
-        elif chip == ChipType.SEGA_ARCADE:
-            n["clockSel"] = flag & 0b11111111
-        elif chip in [
-            ChipType.NEO_GEO_CD,
-            ChipType.NEO_GEO,
-            ChipType.NEO_GEO_EX,
-            ChipType.NEO_GEO_CD_EX,
-            ChipType.YM2610B,
-            ChipType.YM2610B_EX,
-        ]:
-            n["clockSel"] = flag & 0b11111111
-        elif chip == ChipType.AY38910:
-            n["clockSel"] = flag & 0b1111
-            n["chipType"] = (flag >> 4) & 0b11
-            n["stereo"] = bool((flag >> 6) & 1)
-            n["halfClock"] = bool((flag >> 7) & 1)
-            n["stereoSep"] = (flag >> 8) & 0b11111111
-        elif chip == ChipType.AMIGA:
-            n["clockSel"] = flag & 1
-            n["chipType"] = (flag >> 1) & 1
-            n["bypassLimits"] = bool((flag >> 2) & 1)
-            n["stereoSep"] = (flag >> 8) & 0b1111111
-        elif chip == ChipType.YM2151:
-            n["clockSel"] = flag & 0b11111111
-        elif chip in [
-            ChipType.YM2612,
-            ChipType.YM2612_EX,
-            ChipType.YM2612_PLUS,
-            ChipType.YM2612_PLUS_EX,
-        ]:
-            n["clockSel"] = flag & 2147483647  # bits 0-30
-            n["ladderEffect"] = bool((flag >> 31) & 1)
-        elif chip == ChipType.TIA:
-            n["clockSel"] = flag & 1
-            n["mixingType"] = (flag >> 1) & 0b11
-        elif chip == ChipType.VIC20:
-            n["clockSel"] = flag & 1
-        elif chip == ChipType.SNES:
-            n["volScaleL"] = flag & 0b1111111
-            n["volScaleR"] = (flag >> 8) & 0b1111111
-        elif chip in [ChipType.OPLL, ChipType.OPLL_DRUMS]:
-            n["clockSel"] = flag & 0b1111
-            n["patchSet"] = flag >> 4  # safe
-        elif chip == ChipType.N163:
-            n["clockSel"] = flag & 0b1111
-            n["channels"] = (flag >> 4) & 0b111
-            n["multiplex"] = bool((flag >> 7) & 1)
-        elif chip in [ChipType.OPN, ChipType.YM2203_EX]:
-            n["clockSel"] = flag & 0b11111
-            n["prescale"] = (flag >> 5) & 0b11
-        elif chip in [
-            ChipType.OPL,
-            ChipType.OPL_DRUMS,
-            ChipType.OPL2,
-            ChipType.OPL2_DRUMS,
-            ChipType.Y8950,
-            ChipType.Y8950_DRUMS,
-        ]:
-            n["clockSel"] = flag & 0b11111111
-        elif chip in [ChipType.OPL3, ChipType.OPL3_DRUMS]:
-            n["clockSel"] = flag & 0b11111111
-        elif chip == ChipType.PC_SPEAKER:
-            n["speakerType"] = flag & 0b11
-        elif chip == ChipType.RF5C68:
-            n["clockSel"] = flag & 0b1111
-            n["chipType"] = flag >> 4  # safe
-        elif chip in [ChipType.SAA1099, ChipType.OPZ]:
-            n["clockSel"] = flag & 0b11
-        elif chip == ChipType.AY8930:
-            n["clockSel"] = flag & 0b1111
-            n["stereo"] = bool((flag >> 6) & 1)
-            n["halfClock"] = bool((flag >> 7) & 1)
-            n["stereoSep"] = (flag >> 8) & 0b11111111
-        elif chip == ChipType.VRC7:
-            n["clockSel"] = flag & 0b11
-        elif chip == ChipType.ZX_BEEPER:
-            n["clockSel"] = flag & 1
-        elif chip in [ChipType.SCC, ChipType.SCC_PLUS]:
-            n["clockSel"] = flag & 0b11
-        elif chip == ChipType.MSM6295:
-            n["clockSel"] = flag & 0b1111111
-            n["rateSel"] = bool((flag >> 7) & 1)
-        elif chip == ChipType.MSM6258:
-            n["clockSel"] = flag & 0b11
-        elif chip in [ChipType.OPL4, ChipType.OPL4_DRUMS]:
-            n["clockSel"] = flag & 0b11111111
-        elif chip == ChipType.SETA:
-            n["clockSel"] = flag & 0b1111
-            n["stereo"] = bool((flag >> 4) & 1)
-        elif chip == ChipType.ES5506:
-            n["channels"] = flag & 0b11111
-        elif chip == ChipType.TSU:
-            n["clockSel"] = flag & 1
-            n["echo"] = bool((flag >> 2) & 1)
-            n["swapEcho"] = bool((flag >> 3) & 1)
-            n["sampleMemSize"] = (flag >> 4) & 1
-            n["pdm"] = bool((flag >> 5) & 1)
-            n["echoDelay"] = (flag >> 8) & 0b111111
-            n["echoFeedback"] = (flag >> 16) & 0b1111
-            n["echoResolution"] = (flag >> 20) & 0b1111
-            n["echoVol"] = (flag >> 24) & 0b11111111
-        elif chip == ChipType.YMZ280B:
-            n["clockSel"] = flag & 0b11111111
-        elif chip == ChipType.PCM_DAC:
-            n["rate"] = (flag & 0b1111111111111111) + 1
-            n["outDepth"] = (flag >> 16) & 0b1111
-            n["stereo"] = bool((flag >> 20) & 1)
-        elif chip == ChipType.QSOUND:
-            n["echoDelay"] = flag & 0b1111111111111
-            n["echoFeedback"] = (flag >> 16) & 0b11111111
-        return n
-
-    def __read_header(self, stream: BinaryIO) -> None:
+        decoder = OLD_CHIP_FLAG_DECODERS.get(chip)
+        if decoder is None:
+            return {}
+        return decoder(flag)
+
+    def __read_header(self, header: bytes) -> None:
         # assuming we passed the magic number check
-        self.meta.version = read_short(stream)
-        stream.read(2)  # RESERVED
-        self.__song_info_ptr = read_int(stream)
-        stream.read(8)  # RESERVED
+        self.meta.version, self.__song_info_ptr = FILE_HEADER.unpack(header)
 
     def __read_info(self, stream: BinaryIO) -> None:
         stream.seek(self.__song_info_ptr)
@@ -708,162 +779,146 @@ class FurnaceModule:
             raise ValueError('No "INFO" magic')
 
         if self.meta.version < 100:  # don't read size prior to 0.6pre1
-            stream.read(4)
-            info_blk = stream
+            stream.seek(4, SEEK_CUR)
+            info_blk: Union[Cursor, StreamCursor] = StreamCursor(stream)
         else:
             blk_size = read_int(stream)
-            info_blk = BytesIO(stream.read(blk_size))
+            info_blk = Cursor(stream.read(blk_size))
 
         # info of first subsong
-        self.subsongs[0].timing.timebase = read_byte(info_blk) + 1
-        self.subsongs[0].timing.speed = (read_byte(info_blk), read_byte(info_blk))
-        self.subsongs[0].timing.arp_speed = read_byte(info_blk)
-        self.subsongs[0].timing.clock_speed = read_float(info_blk)
-        self.subsongs[0].pattern_length = read_short(info_blk)
-        len_orders = read_short(info_blk)
-        self.subsongs[0].timing.highlight = (read_byte(info_blk), read_byte(info_blk))
-
-        # global
-        num_insts = read_short(info_blk)
-        num_waves = read_short(info_blk)
-        num_samples = read_short(info_blk)
-        num_patterns = read_int(info_blk)
-
-        # fetch chip list
-        for chip_id in info_blk.read(MAX_CHIPS):
-            if chip_id == 0:
-                break  # seek position is after chips here
+        (
+            timebase,
+            speed_1,
+            speed_2,
+            arp_speed,
+            clock_speed,
+            pattern_length,
+            len_orders,
+            highlight_1,
+            highlight_2,
+            num_insts,
+            num_waves,
+            num_samples,
+            num_patterns,
+        ) = info_blk.unpack(INFO_HEADER)
+        self.subsongs[0].timing.timebase = timebase + 1
+        self.subsongs[0].timing.speed = (speed_1, speed_2)
+        self.subsongs[0].timing.arp_speed = arp_speed
+        self.subsongs[0].timing.clock_speed = clock_speed
+        self.subsongs[0].pattern_length = pattern_length
+        self.subsongs[0].timing.highlight = (highlight_1, highlight_2)
+
+        # fetch chip list, which ends at the first 0
+        chip_ids = info_blk.read(MAX_CHIPS).split(b"\x00", 1)[0]
+        for chip_id in chip_ids:
             self.chips.list.append(ChipInfo(ChipType(chip_id)))  # type: ignore
 
-        # fetch volume
-        for i in range(MAX_CHIPS):
-            vol = read_byte(info_blk, True) / 64.0
-            if i >= len(self.chips.list):  # cut here
-                continue
-            self.chips.list[i].volume = vol
-
-        for i in range(MAX_CHIPS):
-            pan = read_byte(info_blk, True) / 128.0
-            if i >= len(self.chips.list):  # cut here
-                continue
-            self.chips.list[i].panning = pan
+        # fetch volume and panning
+        chip_vol_pan = info_blk.unpack(CHIP_VOLUME_PANNING)
+        chip_pannings = chip_vol_pan[MAX_CHIPS:]
+        for chip, vol, pan in zip(self.chips.list, chip_vol_pan, chip_pannings):
+            chip.volume = vol / 64.0
+            chip.panning = pan / 128.0
 
         if self.meta.version >= 119:
-            self.__chip_flag_ptr: List[int] = [
-                read_int(info_blk) for _ in range(MAX_CHIPS)
-            ]
+            self.__chip_flag_ptr: List[int] = info_blk.u32s(MAX_CHIPS)
         else:
-            for i in range(MAX_CHIPS):
-                flag = read_int(info_blk)
-                if i < len(self.chips.list):
-                    self.chips.list[i].flags.update(
-                        self.__convert_old_chip_flags(self.chips.list[i].type, flag)
-                    )
+            for chip, flag in zip(self.chips.list, info_blk.u32s(MAX_CHIPS)):
+                chip.flags.update(self.__convert_old_chip_flags(chip.type, flag))
 
-        self.meta.name = read_str(info_blk)
-        self.meta.author = read_str(info_blk)
-        self.meta.tuning = read_float(info_blk)
+        self.meta.name = info_blk.cstr()
+        self.meta.author = info_blk.cstr()
+        self.meta.tuning = info_blk.f32()
 
         # Compat flags, part I
         self.__read_compat_flags(info_blk, 1)
 
-        self.__instrument_ptr = [read_int(info_blk) for _ in range(num_insts)]
+        self.__instrument_ptr = info_blk.u32s(num_insts)
 
-        self.__wavetable_ptr = [read_int(info_blk) for _ in range(num_waves)]
+        self.__wavetable_ptr = info_blk.u32s(num_waves)
 
-        self.__sample_ptr = [read_int(info_blk) for _ in range(num_samples)]
+        self.__sample_ptr = info_blk.u32s(num_samples)
 
-        self.__pattern_ptr = [read_int(info_blk) for _ in range(num_patterns)]
+        self.__pattern_ptr = info_blk.u32s(num_patterns)
 
         num_channels = self.get_num_channels()
 
-        for channel in range(self.get_num_channels()):
-            self.subsongs[0].order[channel] = [
-                read_byte(info_blk) for _ in range(len_orders)
+        # orders are stored channel by channel, fetch them all at once
+        orders = info_blk.u8s(num_channels * len_orders)
+        for channel in range(num_channels):
+            self.subsongs[0].order[channel] = orders[
+                channel * len_orders : (channel + 1) * len_orders
             ]
 
-        self.subsongs[0].effect_columns = [
-            read_byte(info_blk) for _ in range(num_channels)
-        ]
-
-        # set up channels display info
-        self.subsongs[0].channel_display = [
-            ChannelDisplayInfo() for _ in range(num_channels)
-        ]
-
-        for i in range(num_channels):
-            self.subsongs[0].channel_display[i].shown = bool(read_byte(info_blk))
-
-        for i in range(num_channels):
-            self.subsongs[0].channel_display[i].collapsed = bool(read_byte(info_blk))
+        self.subsongs[0].effect_columns = info_blk.u8s(num_channels)
 
-        for i in range(num_channels):
-            self.subsongs[0].channel_display[i].name = read_str(info_blk)
-
-        for i in range(num_channels):
-            self.subsongs[0].channel_display[i].abbreviation = read_str(info_blk)
+        self.subsongs[0].channel_display = self.__read_channel_display(
+            info_blk, num_channels
+        )
 
-        self.meta.comment = read_str(info_blk)
+        self.meta.comment = info_blk.cstr()
 
         # Master volume
         if self.meta.version >= 59:
-            self.chips.master_volume = read_float(info_blk)
+            self.chips.master_volume = info_blk.f32()
 
         # Compat flags, part II
         if self.meta.version >= 70:
             self.__read_compat_flags(info_blk, 2)
             if self.meta.version >= 96:
                 self.subsongs[0].timing.virtual_tempo = (
-                    read_short(info_blk),
-                    read_short(info_blk),
+                    info_blk.u16(),
+                    info_blk.u16(),
                 )
             else:
-                info_blk.read(4)  # reserved in self.meta.version < 96
+                info_blk.skip(4)  # reserved in self.meta.version < 96
 
         # Subsongs
         if self.meta.version >= 95:
-            self.subsongs[0].name = read_str(info_blk)
-            self.subsongs[0].comment = read_str(info_blk)
-            num_extra_subsongs = read_byte(info_blk)
-            info_blk.read(3)  # reserved
-            self.__subsong_ptr = [read_int(info_blk) for _ in range(num_extra_subsongs)]
+            self.subsongs[0].name = info_blk.cstr()
+            self.subsongs[0].comment = info_blk.cstr()
+            num_extra_subsongs = info_blk.u8()
+            info_blk.skip(3)  # reserved
+            self.__subsong_ptr = info_blk.u32s(num_extra_subsongs)
 
         # Extra metadata
         if self.meta.version >= 103:
-            self.meta.sys_name = read_str(info_blk)
-            self.meta.album = read_str(info_blk)
+            self.meta.sys_name = info_blk.cstr()
+            self.meta.album = info_blk.cstr()
             # TODO: need to take encoding into account
-            self.meta.name_jp = read_str(info_blk)
-            self.meta.author_jp = read_str(info_blk)
-            self.meta.sys_name_jp = read_str(info_blk)
-            self.meta.album_jp = read_str(info_blk)
+            self.meta.name_jp = info_blk.cstr()
+            self.meta.author_jp = info_blk.cstr()
+            self.meta.sys_name_jp = info_blk.cstr()
+            self.meta.album_jp = info_blk.cstr()
 
         # New chip mixer and patchbay
         if self.meta.version >= 135:
-            for i in range(len(self.chips.list)):
+            for chip in self.chips.list:
                 # new chip volume/panning format takes precedence over the legacy one
                 # if you save a .fur with this, legacy and new volume/panning formats
                 # have the same value. different values shouldn't be possible
-                self.chips.list[i].volume = read_float(info_blk)
-                self.chips.list[i].panning = read_float(info_blk)
-                self.chips.list[i].surround = read_float(info_blk)
-            num_patchbay_connections = read_int(info_blk)
-            for _ in range(num_patchbay_connections):
-                src = read_short(info_blk)
-                dst = read_short(info_blk)
+                chip.volume = info_blk.f32()
+                chip.panning = info_blk.f32()
+                chip.surround = info_blk.f32()
+            num_patchbay_connections = info_blk.u32()
+            connections = info_blk.u16s(num_patchbay_connections * 2)
+            for src, dst in zip(connections[0::2], connections[1::2]):
                 self.patchbay.append(
                     PatchBay(
                         dest=InputPatchBayEntry(
-                            set=InputPortSet(src >> 4), port=src & 0b1111
+                            set=INPUT_PORT_SETS.get(src >> 4) or InputPortSet(src >> 4),
+                            port=src & 0b1111,
                         ),
                         source=OutputPatchBayEntry(
-                            set=OutputPortSet(dst >> 4), port=dst & 0b1111
+                            set=OUTPUT_PORT_SETS.get(dst >> 4)
+                            or OutputPortSet(dst >> 4),
+                            port=dst & 0b1111,
                         ),
                     )
                 )
 
         if self.meta.version >= 136:
-            self.compat_flags.auto_patchbay = bool(read_byte(info_blk))
+            self.compat_flags.auto_patchbay = bool(info_blk.u8())
 
         # Compat flags, part III
         if self.meta.version >= 138:
@@ -872,37 +927,64 @@ class FurnaceModule:
         # Speed patterns and grooves
         if self.meta.version >= 139:
             # speed pattern
-            len_speed_pattern = read_byte(info_blk)
+            len_speed_pattern = info_blk.u8()
             if (len_speed_pattern < 0) or (len_speed_pattern > 16):
                 raise ValueError("Invalid speed pattern length value")
-            self.subsongs[0].speed_pattern = [
-                read_byte(info_blk) for _ in range(len_speed_pattern)
-            ]
-            info_blk.read(
+            self.subsongs[0].speed_pattern = info_blk.u8s(len_speed_pattern)
+            info_blk.skip(
                 16 - len_speed_pattern
             )  # skip that many bytes, because it's always 0x06
 
             # groove
-            len_groove_list = read_byte(info_blk)
+            len_groove_list = info_blk.u8()
             for _ in range(len_groove_list):
-                len_groove = read_byte(info_blk)
-                self.subsongs[0].grooves.append(
-                    [read_byte(info_blk) for _ in range(len_groove)]
-                )
-                info_blk.read(
+                len_groove = info_blk.u8()
+                self.subsongs[0].grooves.append(info_blk.u8s(len_groove))
+                info_blk.skip(
                     16 - len_groove
                 )  # TODO: i assume the same as above. i hope i'm right
 
+    @staticmethod
+    def __read_channel_display(
+        blk: Union[Cursor, StreamCursor], num_channels: int
+    ) -> List[ChannelDisplayInfo]:
+        """
+        Reads the channel display info shared by INFO and SONG blocks.
+
+        :param blk: Block positioned at the "shown" flags.
+        :param num_channels: Number of channels in the module.
+        :return: One ChannelDisplayInfo per channel.
+        """
+        # stored column by column: all "shown" flags, all "collapsed" flags,
+        # all names, then all abbreviations
+        display_flags = blk.u8s(num_channels * 2)
+        names = [blk.cstr() for _ in range(num_channels)]
+        abbreviations = [blk.cstr() for _ in range(num_channels)]
+        return [
+            ChannelDisplayInfo(
+                name=name,
+                abbreviation=abbreviation,
+                collapsed=bool(collapsed),
+                shown=bool(shown),
+            )
+            for shown, collapsed, name, abbreviation in zip(
+                display_flags, display_flags[num_channels:], names, abbreviations
+            )
+        ]
+
     def __read_instruments(self, stream: BinaryIO) -> None:
+        # every instrument in a module shares the module's format
+        if self.meta.version < 127:  # i trust this not to screw up
+            import_as = _FurInsImportType.FORMAT_0_EMBED
+        else:
+            import_as = _FurInsImportType.FORMAT_1_EMBED
+
         for i in self.__instrument_ptr:
             if i == 0:
                 break
             stream.seek(i)
             new_ins = FurnaceInstrument()
-            if self.meta.version < 127:  # i trust this not to screw up
-                new_ins.load_from_stream(stream, _FurInsImportType.FORMAT_0_EMBED)
-            else:
-                new_ins.load_from_stream(stream, _FurInsImportType.FORMAT_1_EMBED)
+            new_ins.load_from_stream(stream, import_as)
             self.instruments.append(new_ins)
 
     def __read_wavetables(self, stream: BinaryIO) -> None:
@@ -934,225 +1016,223 @@ class FurnaceModule:
                 if stream.read(4) != b"PATR":
                     raise ValueError('No "PATR" magic')
                 sz = read_int(stream)
+                patr_blk: Union[Cursor, StreamCursor]
                 if sz == 0:
-                    patr_blk = stream
+                    # no size given, so read the pattern straight from the stream
+                    patr_blk = StreamCursor(stream)
                 else:
-                    patr_blk = BytesIO(stream.read(sz))
+                    patr_blk = Cursor(stream.read(sz))
 
                 new_patr = FurnacePattern()
-                new_patr.channel = read_short(patr_blk)
-                new_patr.index = read_short(patr_blk)
-                new_patr.subsong = read_short(patr_blk)
+                new_patr.channel = patr_blk.u16()
+                new_patr.index = patr_blk.u16()
+                new_patr.subsong = patr_blk.u16()
                 if self.meta.version < 95:
                     assert new_patr.subsong == 0
-                read_short(patr_blk)  # reserved
+                patr_blk.u16()  # reserved
 
                 num_rows = self.subsongs[new_patr.subsong].pattern_length
 
-                for _ in range(num_rows):
-                    row = FurnaceRow(
-                        note=Note(read_short(patr_blk)),
-                        octave=read_short(patr_blk),
-                        instrument=read_short(patr_blk),
-                        volume=read_short(patr_blk),
+                effect_columns = self.subsongs[new_patr.subsong].effect_columns[
+                    new_patr.channel
+                ]
+
+                # note, octave, instrument, volume, then effect/value pairs
+                row_struct = struct.Struct("<%dH" % (4 + 2 * effect_columns))
+                rows_size = num_rows * row_struct.size
+                rows_data = patr_blk.read(rows_size)
+                if len(rows_data) != rows_size:
+                    raise struct.error("pattern data ends prematurely")
+
+                for values in row_struct.iter_unpack(rows_data):
+                    note = NOTES.get(values[0]) or Note(values[0])
+                    new_patr.data.append(
+                        FurnaceRow(
+                            note=note,
+                            octave=values[1] + (1 if note == Note.C_ else 0),
+                            instrument=values[2],
+                            volume=values[3],
+                            effects=list(zip(values[4::2], values[5::2])),
+                        )
                     )
-                    row.octave += 1 if row.note == Note.C_ else 0
-                    effect_columns = self.subsongs[new_patr.subsong].effect_columns[
-                        new_patr.channel
-                    ]
-                    row.effects = [
-                        (read_short(patr_blk), read_short(patr_blk))
-                        for _ in range(effect_columns)
-                    ]
-                    new_patr.data.append(row)
 
                 if self.meta.version >= 51:
-                    new_patr.name = read_str(patr_blk)
+                    new_patr.name = patr_blk.cstr()
 
             # New pattern
             else:
                 if stream.read(4) != b"PATN":
                     raise ValueError('No "PATN" magic')
                 sz = read_int(stream)
+                patn_blk: Union[Cursor, StreamCursor]
                 if sz == 0:
-                    patr_blk = stream
+                    patn_blk = StreamCursor(stream)
                 else:
-                    patr_blk = BytesIO(stream.read(sz))
+                    patn_blk = Cursor(stream.read(sz))
 
                 new_patr = FurnacePattern()
-                new_patr.subsong = read_byte(patr_blk)
-                new_patr.channel = read_byte(patr_blk)
-                new_patr.index = read_short(patr_blk)
-                new_patr.name = read_str(patr_blk)
+                new_patr.subsong = patn_blk.u8()
+                new_patr.channel = patn_blk.u8()
+                new_patr.index = patn_blk.u16()
+                new_patr.name = patn_blk.cstr()
 
                 num_rows = self.subsongs[new_patr.subsong].pattern_length
                 effect_columns = self.subsongs[new_patr.subsong].effect_columns[
                     new_patr.channel
                 ]
 
-                empty_row: Callable[[], FurnaceRow] = lambda: FurnaceRow(
-                    Note.__, 0, 0xFFFF, 0xFFFF, [(0xFFFF, 0xFFFF)] * effect_columns
+                if isinstance(patn_blk, Cursor):
+                    data, pos = patn_blk.buf, patn_blk.pos
+                else:
+                    # no size given, read only as much as the rows can take up
+                    data, pos = stream.read(num_rows * PATN_MAX_ROW_SIZE + 1), 0
+                new_patr.data = self.__decode_new_pattern_rows(
+                    data, pos, num_rows, effect_columns
                 )
 
-                row_idx = 0
-                while row_idx < num_rows:
-                    char = read_byte(patr_blk)
-                    # end of pattern
-                    if char == 0xFF:
-                        break
-                    # skip N+2 rows
-                    if char & 0x80:
-                        skip = (char & 0x7F) + 2
-                        row_idx += skip
-                        for _ in range(skip):
-                            new_patr.data.append(empty_row())
-                        continue
-                    # check if some values present
-                    effect_present_list = [False] * 8
-                    effect_val_present_list = [False] * 8
-                    note_present = bool(char & 0x01)
-                    ins_present = bool(char & 0x02)
-                    volume_present = bool(char & 0x04)
-                    effect_present_list[0] = bool(char & 0x08)
-                    effect_val_present_list[0] = bool(char & 0x10)
-                    effect_0_3_present = bool(char & 0x20)
-                    effect_4_7_present = bool(char & 0x40)
-                    if effect_0_3_present:
-                        char = read_byte(patr_blk)
-                        assert effect_present_list[0] == bool(char & 0x01)
-                        assert effect_val_present_list[0] == bool(char & 0x02)
-                        effect_present_list[1] = bool(char & 0x04)
-                        effect_val_present_list[1] = bool(char & 0x08)
-                        effect_present_list[2] = bool(char & 0x10)
-                        effect_val_present_list[2] = bool(char & 0x20)
-                        effect_present_list[3] = bool(char & 0x40)
-                        effect_val_present_list[3] = bool(char & 0x80)
-                    if effect_4_7_present:
-                        char = read_byte(patr_blk)
-                        effect_present_list[4] = bool(char & 0x01)
-                        effect_val_present_list[4] = bool(char & 0x02)
-                        effect_present_list[5] = bool(char & 0x04)
-                        effect_val_present_list[5] = bool(char & 0x08)
-                        effect_present_list[6] = bool(char & 0x10)
-                        effect_val_present_list[6] = bool(char & 0x20)
-                        effect_present_list[7] = bool(char & 0x40)
-                        effect_val_present_list[7] = bool(char & 0x80)
-
-                    # actually read present values
-                    note, octave = Note(0), 0
-                    if note_present:
-                        raw_note = read_byte(patr_blk)
-                        if raw_note == 180:
-                            note = Note.OFF
-                        elif raw_note == 181:
-                            note = Note.OFF_REL
-                        elif raw_note == 182:
-                            note = Note.REL
-                        else:
-                            note_val = raw_note % 12
-                            note_val = 12 if note_val == 0 else note_val
-                            note = Note(note_val)
-                            octave = -5 + raw_note // 12
-
-                    ins, volume = 0xFFFF, 0xFFFF
-                    if ins_present:
-                        ins = read_byte(patr_blk)
-                    if volume_present:
-                        volume = read_byte(patr_blk)
-
-                    row = FurnaceRow(
-                        note=note, octave=octave, instrument=ins, volume=volume
-                    )
+            self.patterns.append(new_patr)
+
+    @staticmethod
+    def __decode_new_pattern_rows(
+        data: bytes, pos: int, num_rows: int, effect_columns: int
+    ) -> List[FurnaceRow]:
+        """
+        Decodes the packed rows of a new-format (PATN) pattern.
 
-                    row.effects = [(0xFFFF, 0xFFFF)] * effect_columns
-                    for i, fx_presents in enumerate(
-                        zip(effect_present_list, effect_val_present_list)
-                    ):
-                        if i >= effect_columns:
-                            break
-                        fx_cmd, fx_val = 0xFFFF, 0xFFFF
-                        if fx_presents[0]:
-                            fx_cmd = read_byte(patr_blk)
-                        if fx_presents[1]:
-                            fx_val = read_byte(patr_blk)
-                        row.effects[i] = (fx_cmd, fx_val)
-
-                    new_patr.data.append(row)
-                    row_idx += 1
-
-                # fill the rest of the pattern with EMPTY
-                while row_idx < num_rows:
-                    new_patr.data.append(empty_row())
-                    row_idx += 1
+        :param data: PATN block contents.
+        :param pos: Where the rows start in `data`, right after the pattern name.
+        :param num_rows: Pattern length.
+        :param effect_columns: Number of effect columns in the pattern's channel.
+        """
+        rows: List[FurnaceRow] = []
+        append_row = rows.append
 
-            self.patterns.append(new_patr)
+        # rows are mutable, so every empty row still gets its own effects list
+        blank_note = Note.__
+        empty_effects = [(0xFFFF, 0xFFFF)] * effect_columns
+
+        row_idx = 0
+        try:
+            while row_idx < num_rows:
+                char = data[pos]
+                pos += 1
+                # end of pattern
+                if char == 0xFF:
+                    break
+                # skip N+2 rows
+                if char & 0x80:
+                    skip = (char & 0x7F) + 2
+                    row_idx += skip
+                    rows.extend(
+                        FurnaceRow(blank_note, 0, 0xFFFF, 0xFFFF, empty_effects[:])
+                        for _ in range(skip)
+                    )
+                    continue
+                # check if some values present. effect_mask holds two bits per
+                # effect column (command, then value), starting from bit 0
+                effect_mask = (char >> 3) & 0b11
+                if char & 0x20:  # effects 0-3
+                    char_0_3 = data[pos]
+                    pos += 1
+                    assert effect_mask == char_0_3 & 0b11
+                    effect_mask |= char_0_3 & 0xFC
+                if char & 0x40:  # effects 4-7
+                    effect_mask |= data[pos] << 8
+                    pos += 1
+
+                # actually read present values
+                note, octave = blank_note, 0
+                if char & 0x01:
+                    note, octave = NEW_PATTERN_NOTES[data[pos]]
+                    pos += 1
+
+                ins, volume = 0xFFFF, 0xFFFF
+                if char & 0x02:
+                    ins = data[pos]
+                    pos += 1
+                if char & 0x04:
+                    volume = data[pos]
+                    pos += 1
+
+                effects = empty_effects[:]
+                i = 0
+                # most rows don't have any effects, this loop is skipped then
+                while effect_mask and i < effect_columns:
+                    fx_cmd, fx_val = 0xFFFF, 0xFFFF
+                    if effect_mask & 1:
+                        fx_cmd = data[pos]
+                        pos += 1
+                    if effect_mask & 2:
+                        fx_val = data[pos]
+                        pos += 1
+                    effects[i] = (fx_cmd, fx_val)
+                    effect_mask >>= 2
+                    i += 1
+
+                append_row(FurnaceRow(note, octave, ins, volume, effects))
+                row_idx += 1
+        except IndexError:
+            # keep the same error as running out of data in a Cursor read
+            raise struct.error("pattern data ends prematurely") from None
+
+        # fill the rest of the pattern with EMPTY
+        rows.extend(
+            FurnaceRow(blank_note, 0, 0xFFFF, 0xFFFF, empty_effects[:])
+            for _ in range(num_rows - row_idx)
+        )
+
+        return rows
 
     def __read_subsongs(self, stream: BinaryIO) -> None:
+        # every subsong shares the module's chip setup
+        num_channels = self.get_num_channels()
         for i in self.__subsong_ptr:
             if i == 0:
                 break
             stream.seek(i)
             if stream.read(4) != b"SONG":
                 raise ValueError('No "SONG" magic')
-            subsong_blk = BytesIO(stream.read(read_int(stream)))
+            subsong_blk = Cursor(stream.read(read_int(stream)))
             new_subsong = SubSong()
             new_subsong.order.clear()
             new_subsong.speed_pattern.clear()
 
-            new_subsong.timing.timebase = read_byte(subsong_blk)
-            new_subsong.timing.speed = (read_byte(subsong_blk), read_byte(subsong_blk))
-            new_subsong.timing.arp_speed = read_byte(subsong_blk)
-            new_subsong.timing.clock_speed = read_float(subsong_blk)
-            new_subsong.pattern_length = read_short(subsong_blk)
-            new_subsong_len_orders = read_short(subsong_blk)
+            new_subsong.timing.timebase = subsong_blk.u8()
+            new_subsong.timing.speed = (subsong_blk.u8(), subsong_blk.u8())
+            new_subsong.timing.arp_speed = subsong_blk.u8()
+            new_subsong.timing.clock_speed = subsong_blk.f32()
+            new_subsong.pattern_length = subsong_blk.u16()
+            len_orders = subsong_blk.u16()
             new_subsong.timing.highlight = (
-                read_byte(subsong_blk),
-                read_byte(subsong_blk),
+                subsong_blk.u8(),
+                subsong_blk.u8(),
             )
             new_subsong.timing.virtual_tempo = (
-                read_short(subsong_blk),
-                read_short(subsong_blk),
+                subsong_blk.u16(),
+                subsong_blk.u16(),
             )
-            new_subsong.name = read_str(subsong_blk)
-            new_subsong.comment = read_str(subsong_blk)
-
-            num_channels = self.get_num_channels()
+            new_subsong.name = subsong_blk.cstr()
+            new_subsong.comment = subsong_blk.cstr()
 
-            for channel in range(self.get_num_channels()):
-                new_subsong.order[channel] = [
-                    read_byte(subsong_blk) for _ in range(new_subsong_len_orders)
+            orders = subsong_blk.u8s(num_channels * len_orders)
+            for channel in range(num_channels):
+                new_subsong.order[channel] = orders[
+                    channel * len_orders : (channel + 1) * len_orders
                 ]
 
-            new_subsong.effect_columns = [
-                read_byte(subsong_blk) for _ in range(num_channels)
-            ]
-
-            # set up channels display info
-            new_subsong.channel_display = [
-                ChannelDisplayInfo() for _ in range(num_channels)
-            ]
-
-            for i in range(num_channels):
-                new_subsong.channel_display[i].shown = bool(read_byte(subsong_blk))
-
-            for i in range(num_channels):
-                new_subsong.channel_display[i].collapsed = bool(read_byte(subsong_blk))
-
-            for i in range(num_channels):
-                new_subsong.channel_display[i].name = read_str(subsong_blk)
+            new_subsong.effect_columns = subsong_blk.u8s(num_channels)
 
-            for i in range(num_channels):
-                new_subsong.channel_display[i].abbreviation = read_str(subsong_blk)
+            new_subsong.channel_display = self.__read_channel_display(
+                subsong_blk, num_channels
+            )
 
             # Speed patterns and grooves
             if self.meta.version >= 139:
                 # speed pattern
-                len_speed_pattern = read_byte(subsong_blk)
+                len_speed_pattern = subsong_blk.u8()
                 if (len_speed_pattern < 0) or (len_speed_pattern > 16):
                     raise ValueError("Invalid speed pattern length value")
-                new_subsong.speed_pattern = [
-                    read_byte(subsong_blk) for _ in range(len_speed_pattern)
-                ]
+                new_subsong.speed_pattern = subsong_blk.u8s(len_speed_pattern)
 
             self.subsongs.append(new_subsong)
 
@@ -1,12 +1,16 @@
-from io import BytesIO
+import struct
 from typing import Optional, Union, BinaryIO, List
 
-from chipchune._util import read_short, read_int, read_str
+from chipchune._util import read_int, read_str
 from .data_types import SampleMeta
 from .enums import _FurSampleType
 
 FILE_MAGIC_STR = b"SMP2"
 
+# everything after the name, up to the sample data. the last 16 bytes are
+# sample presence bitfields
+SAMPLE_HEADER = struct.Struct("<3I4B2I16x")
+
 
 class FurnaceSample:
     def __init__(self) -> None:
@@ -28,20 +32,23 @@ class FurnaceSample:
         if stream.read(len(FILE_MAGIC_STR)) != FILE_MAGIC_STR:
             raise ValueError("Bad magic value for a sample")
         blk_size = read_int(stream)
+        blk_start = stream.tell()
+
+        # read the header straight from the stream, so that the sample
+        # data is only copied once
+        self.meta.name = read_str(stream)
+        (
+            self.meta.length,
+            _,  # compatibility rate
+            _,  # C-4 rate
+            self.meta.bitdepth,
+            _,  # loop direction
+            _,  # flags
+            _,  # flags 2
+            self.meta.loop_start,
+            self.meta.loop_end,
+        ) = SAMPLE_HEADER.unpack(stream.read(SAMPLE_HEADER.size))
+        self.data = stream.read(self.meta.length)
+
         if blk_size > 0:
-            smp_data = BytesIO(stream.read(blk_size))
-        else:
-            smp_data = stream
-
-        self.meta.name = read_str(smp_data)
-        self.meta.length = read_int(smp_data)
-        read_int(smp_data)  # compatablity rate
-        read_int(smp_data)  # C-4 rate
-        self.meta.depth = int(smp_data.read(1)[0])
-        smp_data.read(1)  # loop direction
-        smp_data.read(1)  # flags
-        smp_data.read(1)  # flags 2
-        self.meta.loop_start = read_int(smp_data)
-        self.meta.loop_end = read_int(smp_data)
-        smp_data.read(16)  # sample presence bitfields
-        self.data = smp_data.read(self.meta.length)
+            stream.seek(blk_start + blk_size)
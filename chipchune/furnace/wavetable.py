@@ -1,7 +1,7 @@
 from io import BytesIO
 from typing import Optional, Union, BinaryIO, List
 
-from chipchune._util import read_short, read_int, read_str
+from chipchune._util import read_short, read_int, read_ints, read_str
 from .data_types import WavetableMeta
 from .enums import _FurWavetableImportType
 
@@ -103,4 +103,4 @@ class FurnaceWavetable:
             read_int(wt_data) + 1
         )  # serialized height is 1 lower than actual value
 
-        self.data = [read_int(wt_data) for _ in range(self.meta.width)]
+        self.data = read_ints(wt_data, self.meta.width)
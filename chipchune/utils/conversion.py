@@ -1,10 +1,18 @@
+from chipchune._util import dataclass_slots
 from chipchune.furnace.module import FurnacePattern
+from chipchune.furnace.enums import Note as FurnaceNote
 from chipchune.interchange.enums import InterNote
 from chipchune.interchange.furnace import furnace_note_to_internote
 from typing import Union, List, Tuple
 from dataclasses import dataclass, field
 
+# empty tracker row
+BLANK_NOTE: FurnaceNote = FurnaceNote.__
+# effects of a row with a single, empty effect column
+BLANK_EFFECTS = [(65535, 65535)]
 
+
+@dataclass_slots
 @dataclass
 class SequenceEntry:
     """
@@ -52,47 +60,37 @@ def pattern_to_sequence(pattern: Union[FurnacePattern, None]) -> List[SequenceEn
 
 def furnace_pattern_to_sequence(pattern: FurnacePattern) -> List[SequenceEntry]:
     converted: List[SequenceEntry] = []
+    append = converted.append
+    to_internote = furnace_note_to_internote
     last_volume = -1
     for i in pattern.data:
-        note = furnace_note_to_internote(i.note)
-        effects = i.effects
         volume = i.volume
-        instrument = i.instrument
-
-        if effects == [(65535, 65535)]:
-            effects = []
-
         if volume == 65535:
             volume = last_volume
         else:
             last_volume = volume
 
+        # blank rows just lengthen the current entry
+        if converted and i.note is BLANK_NOTE:
+            converted[-1].length += 1
+            continue
+
+        effects = i.effects
+        if effects == BLANK_EFFECTS:
+            effects = []
+
+        instrument = i.instrument
         if instrument == 65535:
             instrument = -1
 
-        if note == InterNote.__:
-            if len(converted) == 0:
-                converted.append(
-                    SequenceEntry(
-                        note=InterNote.__,
-                        length=1,
-                        volume=volume,
-                        octave=i.octave,
-                        instrument=instrument,
-                        effects=effects,
-                    )
-                )
-            else:
-                converted[-1].length += 1
-        else:
-            converted.append(
-                SequenceEntry(
-                    note=note,
-                    length=1,
-                    volume=volume,
-                    octave=i.octave,
-                    instrument=instrument,
-                    effects=effects,
-                )
+        append(
+            SequenceEntry(
+                note=to_internote(i.note),
+                length=1,
+                volume=volume,
+                octave=i.octave,
+                instrument=instrument,
+                effects=effects,
             )
+        )
     return converted
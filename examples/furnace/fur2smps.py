@@ -1,8 +1,10 @@
 from chipchune.furnace.module import FurnaceModule, FurnacePattern
 from chipchune.furnace.enums import ChipType
 from chipchune.interchange.enums import InterNote
+from chipchune.utils.conversion import SequenceEntry
 import chipchune.utils.conversion as convert
-from typing import cast, List
+import sys
+from typing import cast, Dict, Iterator, List, Tuple
 
 inter_note_to_smps = {
     InterNote.__: "nRst",
@@ -23,100 +25,120 @@ inter_note_to_smps = {
     InterNote.B_: "nB",
 }
 
+# rests are the only notes written without an octave
+smps_note_has_octave = {
+    inter_note: smps_note != "nRst"
+    for inter_note, smps_note in inter_note_to_smps.items()
+}
+
+
+def sequence_to_smps(
+    label: str,
+    sequence: List[SequenceEntry],
+    note_prefixes: Dict[Tuple[InterNote, int], str],
+) -> List[str]:
+    lines = ["", label]
+    append = lines.append
+    note_names = inter_note_to_smps
+    note_has_octave = smps_note_has_octave
+    cur_instrument = -1
+    cur_volume = -1
+    for s in sequence:
+        volume = s.volume
+        instrument = s.instrument
+        if volume != cur_volume:
+            cur_volume = volume
+            append(f"\tsmpsSetVol {volume - 10}")
+        if instrument != -1 and instrument != cur_instrument:
+            cur_instrument = instrument
+            append(f"\tsmpsSetvoice {instrument}")
+
+        key = (s.note, s.octave)
+        prefix = note_prefixes.get(key)
+        if prefix is None:
+            inter_note, octave = key
+            if inter_note not in note_names:
+                raise KeyError("No SMPS equivalent for note %s" % inter_note)
+            note = note_names[inter_note]
+            if note_has_octave[inter_note]:
+                note += str(octave)
+            prefix = note_prefixes[key] = f"\tdc.b {note}, "
 
-def fur2smps(module: FurnaceModule, title: str) -> List[str]:
+        append(prefix + str(s.length))
+    append("\tsmpsReturn")
+    return lines
+
+
+def fur2smps(module: FurnaceModule, title: str) -> Iterator[str]:
     if not (
         len(module.chips.list) > 1
         and module.chips.list[0].type == ChipType.YM2612
         and module.chips.list[1].type == ChipType.SMS
     ):
         raise Exception("Not a (Furnace) Genesis module")
+    return smps_lines(module, title)
 
-    lines: List[str] = []
 
-    lines += [
-        "%s_Header:" % title,
+def smps_lines(module: FurnaceModule, title: str) -> Iterator[str]:
+    yield from (
+        f"{title}_Header:",
         # Sonic 3&K track
         "\tsmpsHeaderStartSong 3",
         "\tsmpsHeaderVoice S3_UVB",
         "\tsmpsHeaderChan 6, 3",
         # TODO
         "\tsmpsHeaderTempo 6, $38",
-        "\tsmpsHeaderDAC %s_DAC, 0, $a" % title,
-        "\tsmpsHeaderFM %s_FM0, 0, 0" % title,
-        "\tsmpsHeaderFM %s_FM1, 0, 0" % title,
-        "\tsmpsHeaderFM %s_FM2, 0, 0" % title,
-        "\tsmpsHeaderFM %s_FM3, 0, 0" % title,
-        "\tsmpsHeaderFM %s_FM4, 0, 0" % title,
-        "\tsmpsHeaderPSG %s_PSG6, 0, 0, 0, sTone_0C" % title,
-        "\tsmpsHeaderPSG %s_PSG7, 0, 0, 0, sTone_0C" % title,
-        "\tsmpsHeaderPSG %s_PSG9, 0, 0, 0, sTone_0C" % title,
-    ]
-
-    for i in range(module.get_num_channels()):
-        order = module.subsongs[0].order[i]
+        f"\tsmpsHeaderDAC {title}_DAC, 0, $a",
+        f"\tsmpsHeaderFM {title}_FM0, 0, 0",
+        f"\tsmpsHeaderFM {title}_FM1, 0, 0",
+        f"\tsmpsHeaderFM {title}_FM2, 0, 0",
+        f"\tsmpsHeaderFM {title}_FM3, 0, 0",
+        f"\tsmpsHeaderFM {title}_FM4, 0, 0",
+        f"\tsmpsHeaderPSG {title}_PSG6, 0, 0, 0, sTone_0C",
+        f"\tsmpsHeaderPSG {title}_PSG7, 0, 0, 0, sTone_0C",
+        f"\tsmpsHeaderPSG {title}_PSG9, 0, 0, 0, sTone_0C",
+    )
+
+    # "\tdc.b <note>, " for every (note value, octave) seen so far
+    note_prefixes: Dict[Tuple[InterNote, int], str] = {}
+
+    num_channels = module.get_num_channels()
+    patterns_by_channel: List[List[FurnacePattern]] = [[] for _ in range(num_channels)]
+    for p in module.patterns:
+        if p.subsong == 0:
+            patterns_by_channel[p.channel].append(p)
+
+    for i in range(num_channels):
         if i == 8:  # ignored
-            pass
-        else:
-            lines += ["", ""]
-            if i < 5:  # FM channels
-                lines += ["%s_FM%d:" % (title, i)]
-                lines += [
-                    "\tsmpsCall %s_FM%d_%02x" % (title, i, ord_num) for ord_num in order
-                ]
-            elif i == 5:  # DAC
-                lines += ["%s_DAC:" % (title)]
-                lines += [
-                    "\tsmpsCall %s_DAC_%02x" % (title, ord_num) for ord_num in order
-                ]
-            else:  # PSG channels
-                lines += ["%s_PSG%d:" % (title, i)]
-                lines += [
-                    "\tsmpsCall %s_PSG%d_%02x" % (title, i, ord_num)
-                    for ord_num in order
-                ]
-            lines += ["\tsmpsStop"]
-
-            avail_patterns = filter(
-                lambda x: (x.channel == i and x.subsong == 0), module.patterns
+            continue
+
+        order = module.subsongs[0].order[i]
+        if i < 5:  # FM channels
+            prefix = f"{title}_FM{i}"
+        elif i == 5:  # DAC
+            prefix = f"{title}_DAC"
+        else:  # PSG channels
+            prefix = f"{title}_PSG{i}"
+
+        yield from ("", "", f"{prefix}:")
+        yield from (f"\tsmpsCall {prefix}_{ord_num:02x}" for ord_num in order)
+        yield "\tsmpsStop"
+
+        for p in patterns_by_channel[i]:
+            sequence = convert.pattern_to_sequence(p)
+            yield from sequence_to_smps(
+                f"{prefix}_{p.index:02x}:", sequence, note_prefixes
             )
-            for p in avail_patterns:
-                lines += [""]
-                if i < 5:  # FM channels
-                    lines += ["%s_FM%d_%02x:" % (title, i, p.index)]
-                elif i == 5:  # DAC
-                    lines += ["%s_DAC_%02x:" % (title, p.index)]
-                else:  # PSG channels
-                    lines += ["%s_PSG%d_%02x:" % (title, i, p.index)]
-                sequence = convert.pattern_to_sequence(p)
-                cur_instrument = -1
-                cur_volume = -1
-                # print(p)
-                for s in sequence:
-                    if s.volume != cur_volume:
-                        cur_volume = s.volume
-                        lines += ["\tsmpsSetVol %d" % (cur_volume - 10)]
-                    if s.instrument != -1 and s.instrument != cur_instrument:
-                        cur_instrument = s.instrument
-                        lines += ["\tsmpsSetvoice %d" % cur_instrument]
-
-                    note = inter_note_to_smps[s.note]
-                    if note != "nRst":
-                        note += str(s.octave)
-
-                    lines += [
-                        # "\t;%s" % str(s),
-                        "\tdc.b %s, %d"
-                        % (note, s.length)
-                    ]
-                lines += ["\tsmpsReturn"]
-    return lines
 
 
-module = FurnaceModule("files/rocky_mountain.197.fur")
-print("\n".join(fur2smps(module, "RockyMtn1")))
+if __name__ == "__main__":
+    # usage: fur2smps.py [module.fur] [title]
+    path = sys.argv[1] if len(sys.argv) > 1 else "files/rocky_mountain.197.fur"
+    title = sys.argv[2] if len(sys.argv) > 2 else "RockyMtn1"
+    module = FurnaceModule(path)
+    sys.stdout.writelines(line + "\n" for line in fur2smps(module, title))
 
-# pattern = module.get_pattern(3, 1, 0)
+    # pattern = module.get_pattern(3, 1, 0)
 
-# for i in convert.pattern_to_sequence(pattern):
-#     print(i)
+    # for i in convert.pattern_to_sequence(pattern):
+    #     print(i)
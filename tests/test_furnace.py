@@ -17,42 +17,42 @@ from chipchune.furnace.wavetable import FurnaceWavetable
 # pytest --cov=chipchune
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dev_70() -> FurnaceModule:
     return FurnaceModule("samples/furnace/skate_or_die.70.fur")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dev_143() -> FurnaceModule:
     return FurnaceModule("samples/furnace/skate_or_die.143.fur")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dev_181() -> FurnaceModule:
     return FurnaceModule("samples/furnace/skate_or_die.181.fur")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def dev_140() -> FurnaceModule:
     return FurnaceModule("samples/furnace/map04.140.fur")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_ins() -> FurnaceInstrument:
     return FurnaceInstrument("samples/furnace/opl1_brass.new.fui")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_ins_2() -> FurnaceInstrument:
     return FurnaceInstrument("samples/furnace/bass.new.fui")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def old_ins() -> FurnaceInstrument:
     return FurnaceInstrument("samples/furnace/opl1_brass.old.fui")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wav_181() -> FurnaceWavetable:
     return FurnaceWavetable("samples/furnace/skate_or_die.181.wave.1.fuw")
 
@@ -81,22 +81,19 @@ def test_info(dev_70: FurnaceModule, dev_143: FurnaceModule) -> None:
 
 def test_compat_flags(dev_70: FurnaceModule, dev_143: FurnaceModule) -> None:
     # make sure default compat flags match
-    for k, v in dev_70.compat_flags.__dict__.items():
-        assert v == dev_143.compat_flags.__dict__[k], (
-            "compat_flags.%s does not match" % k
-        )
+    assert dev_70.compat_flags == dev_143.compat_flags
 
 
 def test_old2new_chip_flag_convert(
     dev_70: FurnaceModule, dev_143: FurnaceModule
 ) -> None:
     # make sure old chip flags are correctly converted to new ones
-    for i in range(len(dev_70.chips.list)):
-        for k, v in dev_70.chips.list[i].flags.items():
-            if k in dev_143.chips.list[i].flags.keys():
-                assert (
-                    v == dev_143.chips.list[i].flags[k]
-                ), 'chips.list[%d].flags["%s"] does not match' % (i, k)
+    for i, old in enumerate(dev_70.chips.list):
+        new = dev_143.chips.list[i]
+        common = old.flags.keys() & new.flags.keys()
+        assert {k: old.flags[k] for k in common} == {k: new.flags[k] for k in common}, (
+            "chips.list[%d].flags does not match" % i
+        )
 
 
 @pytest.mark.skip
@@ -185,23 +182,27 @@ def test_if_old_instr_the_same(dev_70: FurnaceModule, dev_143: FurnaceModule) ->
         try:
             for i in a.features:
                 if type(i) is InsFeatureMacro:
-                    a_vol = next(filter(lambda x: x.kind == MacroCode.VOL, i.macros))
-                    a_arp = next(filter(lambda x: x.kind == MacroCode.ARP, i.macros))
-                    a_duty = next(filter(lambda x: x.kind == MacroCode.DUTY, i.macros))
-                    a_wave = next(filter(lambda x: x.kind == MacroCode.WAVE, i.macros))
+                    # first macro of each kind; MacroCode itself is unhashable
+                    macros = {m.kind.value: m for m in reversed(i.macros)}
+                    a_vol = macros[MacroCode.VOL.value]
+                    a_arp = macros[MacroCode.ARP.value]
+                    a_duty = macros[MacroCode.DUTY.value]
+                    a_wave = macros[MacroCode.WAVE.value]
 
             for i in b.features:
                 if type(i) is InsFeatureMacro:
-                    b_vol = next(filter(lambda x: x.kind == MacroCode.VOL, i.macros))
-                    b_arp = next(filter(lambda x: x.kind == MacroCode.ARP, i.macros))
-                    b_duty = next(filter(lambda x: x.kind == MacroCode.DUTY, i.macros))
-                    b_wave = next(filter(lambda x: x.kind == MacroCode.WAVE, i.macros))
+                    # first macro of each kind; MacroCode itself is unhashable
+                    macros = {m.kind.value: m for m in reversed(i.macros)}
+                    b_vol = macros[MacroCode.VOL.value]
+                    b_arp = macros[MacroCode.ARP.value]
+                    b_duty = macros[MacroCode.DUTY.value]
+                    b_wave = macros[MacroCode.WAVE.value]
 
             assert a_vol == b_vol
             assert a_arp == b_arp
             assert a_duty == b_duty
             assert a_wave == b_wave
-        except StopIteration:
+        except KeyError:
             continue
 
 